@@ -13,7 +13,7 @@ else:
     import bpy
     from bpy.props import PointerProperty
 
-    from . import localization, operators, preferences, ui
+    from . import handlers, localization, operators, preferences, ui
 
 
 classes = essentials.get_classes((preferences, ui, operators))
@@ -33,6 +33,11 @@ def register():
     bpy.types.VIEW3D_MT_edit_mesh.append(ui.draw_booltron_menu)
     bpy.types.VIEW3D_MT_edit_curve.append(ui.draw_booltron_menu)
 
+    # Handlers
+    # ---------------------------
+
+    handlers.register()
+
     # Translations
     # ---------------------------
 
@@ -55,6 +60,11 @@ def unregister():
     bpy.types.VIEW3D_MT_edit_mesh.remove(ui.draw_booltron_menu)
     bpy.types.VIEW3D_MT_edit_curve.remove(ui.draw_booltron_menu)
 
+    # Handlers
+    # ---------------------------
+
+    handlers.unregister()
+
     # Translations
     # ---------------------------
 
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2014-2026 Mikhail Rachinskiy
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from bpy.app.handlers import persistent
+
+from . import var
+
+
+# Reverse index
+# ---------------------------
+
+
+@persistent
+def index_reset(*args) -> None:
+    from .lib import modlib
+
+    modlib.index_invalidate()
+
+
+@persistent
+def index_validate(scene, depsgraph) -> None:
+    from .lib import modlib
+
+    modlib.index_validate(depsgraph)
+
+
+def _is_transform() -> bool:
+    return any(op.bl_idname.startswith("TRANSFORM_OT") for win in bpy.context.window_manager.windows for op in win.modal_operators)
+
+
+# Transform preview
+# ---------------------------
+
+_preview: set[tuple[str, str]] = set()
+
+
+@persistent
+def preview_track(scene, depsgraph) -> None:
+    props = scene.booltron
+    if not (props.use_preview and props.mod_disable) or not _is_transform():
+        return
+
+    from .lib import modlib
+    from .lib.modlib import ModGN
+
+    obs = {
+        update.id.original for update in depsgraph.updates
+        if isinstance(update.id, bpy.types.Object) and update.is_updated_transform
+    }
+    if not obs:
+        return
+
+    for owner, mds in modlib.index_lookup(obs).items():
+        for md in mds:
+            key = (owner.name, md.name)
+            if key not in _preview and not ModGN.is_baked(md) and modlib.preview_set(md):
+                _preview.add(key)
+
+    if _preview and not bpy.app.timers.is_registered(preview_restore):
+        bpy.app.timers.register(preview_restore, first_interval=0.1)
+
+
+def preview_restore() -> float | None:
+    from .lib import modlib
+
+    if _is_transform():
+        return 0.1
+
+    for ob_name, md_name in _preview:
+        if (ob := bpy.data.objects.get(ob_name)) and (md := ob.modifiers.get(md_name)) and md.node_group:
+            modlib.preview_clear(md)
+    _preview.clear()
+
+
+# Auto bake
+# ---------------------------
+
+_auto_bake_pending: set[tuple[str, str]] = set()
+
+
+@persistent
+def auto_bake_track(scene, depsgraph) -> None:
+    if not scene.booltron.use_auto_bake or not bpy.data.is_saved:
+        return
+
+    from .lib import modlib
+    from .lib.modlib import ModGN
+
+    obs = {
+        update.id.original for update in depsgraph.updates
+        if isinstance(update.id, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry)
+    }
+    if not obs:
+        return
+
+    for owner, mds in modlib.index_lookup(obs).items():
+        for md in mds:
+            if ModGN.is_baked(md):
+                _auto_bake_pending.add((owner.name, md.name))
+
+    if not _auto_bake_pending:
+        return
+
+    # Restart countdown on every change
+    if bpy.app.timers.is_registered(auto_bake):
+        bpy.app.timers.unregister(auto_bake)
+
+    prefs = bpy.context.preferences.addons[var.ADDON_ID].preferences
+    bpy.app.timers.register(auto_bake, first_interval=prefs.auto_bake_delay)
+
+
+def auto_bake() -> float | None:
+    from .lib import modlib
+    from .lib.modlib import ModGN
+
+    wm = bpy.context.window_manager
+
+    # Wait for transform to finish
+    if _is_transform():
+        return bpy.context.preferences.addons[var.ADDON_ID].preferences.auto_bake_delay
+
+    mds = set()
+    for ob_name, md_name in _auto_bake_pending:
+        if (ob := bpy.data.objects.get(ob_name)) and (md := ob.modifiers.get(md_name)) and ModGN.is_gn_mod(md):
+            mds.add(md)
+    _auto_bake_pending.clear()
+
+    if not mds or not wm.windows:
+        return
+
+    with bpy.context.temp_override(window=wm.windows[0]):
+        for wave in modlib.bake_schedule(mds):
+            for chain in wave:
+                for md in chain:
+                    if md in mds or ModGN.is_baked(md):
+                        ModGN.bake(md)
+
+
+# Registration
+# ---------------------------
+
+
+def register() -> None:
+    bpy.app.handlers.load_post.append(index_reset)
+    bpy.app.handlers.undo_post.append(index_reset)
+    bpy.app.handlers.redo_post.append(index_reset)
+    bpy.app.handlers.depsgraph_update_post.append(index_validate)
+    bpy.app.handlers.depsgraph_update_post.append(preview_track)
+    bpy.app.handlers.depsgraph_update_post.append(auto_bake_track)
+
+
+def unregister() -> None:
+    bpy.app.handlers.load_post.remove(index_reset)
+    bpy.app.handlers.undo_post.remove(index_reset)
+    bpy.app.handlers.redo_post.remove(index_reset)
+    bpy.app.handlers.depsgraph_update_post.remove(index_validate)
+    bpy.app.handlers.depsgraph_update_post.remove(preview_track)
+    bpy.app.handlers.depsgraph_update_post.remove(auto_bake_track)
+
+    for timer in (preview_restore, auto_bake):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2014-2026 Mikhail Rachinskiy
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import hashlib
+import os
+from pathlib import Path
+
+import bpy
+import numpy as np
+from bpy.types import Mesh, Object
+
+from .. import var
+from . import modlib
+
+_ATTR_FORMAT = {
+    "FLOAT": ("value", 1, np.float32),
+    "INT": ("value", 1, np.int32),
+    "INT8": ("value", 1, np.int8),
+    "BOOLEAN": ("value", 1, bool),
+    "FLOAT2": ("vector", 2, np.float32),
+    "INT32_2D": ("value", 2, np.int32),
+    "FLOAT_VECTOR": ("vector", 3, np.float32),
+    "FLOAT_COLOR": ("color", 4, np.float32),
+    "BYTE_COLOR": ("color", 4, np.float32),
+    "QUATERNION": ("value", 4, np.float32),
+}
+
+
+def _dir() -> Path:
+    return Path(bpy.utils.extension_path_user(var.ADDON_ID, path="cache", create=True))
+
+
+def hash_mesh(h: hashlib.blake2b, me: Mesh) -> None:
+    for coll, prop, size, dtype in (
+        (me.vertices, "co", 3, np.float32),
+        (me.edges, "vertices", 2, np.int32),
+        (me.loops, "vertex_index", 1, np.int32),
+        (me.polygons, "loop_start", 1, np.int32),
+        (me.polygons, "material_index", 1, np.int32),
+    ):
+        arr = np.empty(len(coll) * size, dtype=dtype)
+        coll.foreach_get(prop, arr)
+        h.update(arr.tobytes())
+
+    for attr in me.attributes:
+        h.update(f"{attr.name}:{attr.domain}:{attr.data_type}".encode())
+        if (fmt := _ATTR_FORMAT.get(attr.data_type)) is None:
+            continue
+        prop, size, dtype = fmt
+        arr = np.empty(len(attr.data) * size, dtype=dtype)
+        attr.data.foreach_get(prop, arr)
+        h.update(arr.tobytes())
+
+    h.update("\n".join(mat.name if mat else "" for mat in me.materials).encode())
+
+
+def key(ob1: Object, obs: list[Object], mode: str, settings: dict) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{bpy.app.version}:{var.ADDON_VERSION}:{modlib.CORE_VERSION}:{mode}:{sorted(settings.items())}".encode())
+
+    for ob in (ob1, *obs):
+        h.update(np.array(ob.matrix_world, dtype=np.float32).tobytes())
+        hash_mesh(h, ob.data)
+
+    return h.hexdigest()
+
+
+def load(key: str) -> Mesh | None:
+    path = _dir() / f"{key}.blend"
+    if not path.exists():
+        return
+
+    with bpy.data.libraries.load(str(path)) as (data_from, data_to):
+        data_to.meshes = data_from.meshes
+
+    if not data_to.meshes:
+        return
+
+    os.utime(path)
+
+    me = data_to.meshes[0]
+    me.use_fake_user = False
+    for i, name in enumerate(me.pop("booltron_materials", "").split("\n")):
+        if i < len(me.materials):
+            me.materials[i] = bpy.data.materials.get(name)
+
+    return me
+
+
+def store(key: str, me: Mesh, size_limit: int) -> None:
+    me = me.copy()
+
+    # Keep material indices, link materials by name on load
+    me["booltron_materials"] = "\n".join(mat.name if mat else "" for mat in me.materials)
+    for i in range(len(me.materials)):
+        me.materials[i] = None
+
+    cache_dir = _dir()
+    path = cache_dir / f"{key}.blend"
+    path_tmp = cache_dir / f"{key}.tmp"
+
+    bpy.data.libraries.write(str(path_tmp), {me}, fake_user=True)
+    bpy.data.meshes.remove(me)
+    os.replace(path_tmp, path)
+
+    _trim(cache_dir, size_limit * 1024 * 1024)
+
+
+def _trim(cache_dir: Path, size_limit: int) -> None:
+    files = sorted(cache_dir.glob("*.blend"), key=lambda x: x.stat().st_mtime)
+    size = sum(x.stat().st_size for x in files)
+
+    for path in files:
+        if size <= size_limit:
+            break
+        size -= path.stat().st_size
+        path.unlink()
+
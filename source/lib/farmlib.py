@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2014-2026 Mikhail Rachinskiy
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+
+import bpy
+
+_WORKER = """
+import json, sys
+import bpy
+
+for ob_name, md_name, directory, bake_ids in json.loads(sys.argv[sys.argv.index("--") + 1]):
+    ob = bpy.data.objects[ob_name]
+    md = ob.modifiers[md_name]
+    md.bake_directory = directory
+    core = md.node_group.nodes.get("CORE")
+    is_exact = core is not None and "Exact" in core.inputs
+    if is_exact:
+        core.inputs["Exact"].default_value = True
+    for bake_id in bake_ids:
+        bpy.ops.object.geometry_node_bake_single(session_uid=ob.session_uid, modifier_name=md.name, bake_id=bake_id)
+    if is_exact:
+        core.inputs["Exact"].default_value = False
+    print("BOOLTRON_BAKED", json.dumps([ob_name, md_name]), flush=True)
+"""
+
+
+def _read(proc: subprocess.Popen, messages: queue.Queue, log: deque) -> None:
+    for line in proc.stdout:
+        if line.startswith("BOOLTRON_BAKED "):
+            messages.put(tuple(json.loads(line[15:])))
+        else:
+            log.append(line.rstrip())
+
+
+class Farm:
+    __slots__ = "procs", "threads", "messages", "log", "tempdir", "total", "done"
+
+    def __init__(self, jobs: list[list[tuple[str, str, str, list[int]]]], workers: int) -> None:
+        # Job is a chain of (object name, modifier name, bake directory, bake ids),
+        # modifiers in a chain depend on each other and are baked by the same worker
+        self.tempdir = Path(tempfile.mkdtemp(prefix="booltron_"))
+        self.messages = queue.Queue()
+        self.total = sum(len(chain) for chain in jobs)
+        self.done: list[tuple[str, str]] = []
+        self.procs: list[subprocess.Popen] = []
+        self.threads: list[threading.Thread] = []
+        self.log = deque(maxlen=200)
+
+        snapshot = self.tempdir / "snapshot.blend"
+        bpy.ops.wm.save_as_mainfile(filepath=str(snapshot), copy=True)
+
+        # Longest chains first, to the least loaded worker
+        batches = [[] for _ in range(max(1, min(workers, len(jobs))))]
+        for chain in sorted(jobs, key=len, reverse=True):
+            min(batches, key=len).extend(chain)
+
+        for batch in batches:
+            proc = subprocess.Popen(
+                (
+                    bpy.app.binary_path,
+                    "--background",
+                    "--factory-startup",
+                    "-noaudio",
+                    str(snapshot),
+                    "--python-expr",
+                    _WORKER,
+                    "--",
+                    json.dumps(batch),
+                ),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            thread = threading.Thread(target=_read, args=(proc, self.messages, self.log), daemon=True)
+            thread.start()
+            self.procs.append(proc)
+            self.threads.append(thread)
+
+    def poll(self) -> list[tuple[str, str]]:
+        baked = []
+
+        while True:
+            try:
+                baked.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+
+        self.done += baked
+        return baked
+
+    def is_running(self) -> bool:
+        if any(proc.poll() is None for proc in self.procs):
+            return True
+
+        # Output of exited processes can still be in transit
+        for thread in self.threads:
+            thread.join()
+
+        return not self.messages.empty()
+
+    def cancel(self) -> None:
+        for proc in self.procs:
+            if proc.poll() is None:
+                proc.terminate()
+
+    def cleanup(self) -> None:
+        for proc in self.procs:
+            proc.wait()
+        shutil.rmtree(self.tempdir, ignore_errors=True)
@@ -1,10 +1,14 @@
 # SPDX-FileCopyrightText: 2014-2026 Mikhail Rachinskiy
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import itertools
+from collections.abc import Iterator
+
 import bmesh
 import bpy
-from bpy.types import Object
-from mathutils import bvhtree
+import numpy as np
+from bpy.types import Mesh, Object
+from mathutils import Vector, bvhtree
 
 
 def _delete_loose(bm: bmesh.types.BMesh) -> None:
@@ -13,63 +17,574 @@ def _delete_loose(bm: bmesh.types.BMesh) -> None:
             bm.verts.remove(v)
 
 
-def prepare(obs: list[Object], merge_distance: float, dissolve_distance: float, check: bool, select: bool = False) -> bool:
-    for ob in obs:
-        me = ob.data
-        bm = bmesh.new()
-        bm.from_mesh(me)
+def _edge_face_count(me: Mesh) -> np.ndarray:
+    loop_edges = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("edge_index", loop_edges)
+    return np.bincount(loop_edges, minlength=len(me.edges))
+
+
+def _has_doubles(co: np.ndarray, dist: float) -> bool:
+    # Spatial hash with cell size 2 * dist over eight shifted grids,
+    # vertices closer than dist share a cell in at least one of them
+    size = dist * 2.0
+
+    for shift in itertools.product((0.0, dist), repeat=3):
+        keys = np.floor((co + shift) / size).astype(np.int64)
+        keys = keys[np.lexsort(keys.T)]
+        if np.any(np.all(keys[1:] == keys[:-1], axis=1)):
+            return True
+
+    return False
+
+
+def _analyze(me: Mesh, merge_distance: float, dissolve_distance: float) -> set[str]:
+    issues = set()
+
+    if not me.vertices:
+        return issues
+
+    co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    co.shape = (-1, 3)
+
+    edge_verts = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edge_verts)
+    edge_verts.shape = (-1, 2)
+
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+
+    face_area = np.empty(len(me.polygons), dtype=np.float32)
+    me.polygons.foreach_get("area", face_area)
+
+    edge_len = np.linalg.norm(co[edge_verts[:, 0]] - co[edge_verts[:, 1]], axis=1)
+    edge_faces = _edge_face_count(me)
+
+    if _has_doubles(co, merge_distance):
+        issues.add("DOUBLES")
+    if np.any(edge_len < dissolve_distance) or np.any(face_area < dissolve_distance ** 2):
+        issues.add("DEGENERATE")
+    if not np.all(np.bincount(loop_verts, minlength=len(co))):
+        issues.add("LOOSE")
+    if np.any(edge_faces == 1):
+        issues.add("HOLES")
+    if np.any(edge_faces != 2):
+        issues.add("NONMANIFOLD")
+
+    return issues
 
+
+def _cleanup(me: Mesh, issues: set[str], merge_distance: float, dissolve_distance: float) -> None:
+    bm = bmesh.new()
+    bm.from_mesh(me)
+
+    if "DOUBLES" in issues:
         bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+    if issues & {"DOUBLES", "DEGENERATE"}:
         bmesh.ops.dissolve_degenerate(bm, edges=bm.edges, dist=dissolve_distance)
+    if issues & {"DOUBLES", "DEGENERATE", "LOOSE"}:
         _delete_loose(bm)
-        bmesh.ops.holes_fill(bm, edges=bm.edges)
 
-        if check:
-            for e in bm.edges:
-                if not e.is_manifold:
-                    bm.free()
-                    return True
+    bmesh.ops.holes_fill(bm, edges=[e for e in bm.edges if e.is_boundary])
 
-        for f in bm.faces:
-            f.select = select
+    bm.to_mesh(me)
+    bm.free()
 
-        bm.to_mesh(me)
-        bm.free()
+
+def prepare(obs: list[Object], merge_distance: float, dissolve_distance: float, check: bool, select: bool = False) -> bool:
+    for ob in obs:
+        me = ob.data
+        issues = _analyze(me, merge_distance, dissolve_distance)
+
+        if issues - {"NONMANIFOLD"}:
+            _cleanup(me, issues, merge_distance, dissolve_distance)
+            issues = {"NONMANIFOLD"} if np.any(_edge_face_count(me) != 2) else set()
+
+        if check and "NONMANIFOLD" in issues:
+            return True
+
+        face_select = np.full(len(me.polygons), select, dtype=bool)
+        me.polygons.foreach_set("select", face_select)
 
     return False
 
 
-def detect_overlap(obs: list[Object]) -> bool:
-    props = bpy.context.window_manager.booltron.destructive
-    depsgraph = bpy.context.evaluated_depsgraph_get()
-    bm = bmesh.new()
+def bounds(ob: Object) -> np.ndarray:
+    co = np.array([ob.matrix_world @ Vector(v) for v in ob.bound_box])
+    return np.array((co.min(axis=0), co.max(axis=0)))
+
+
+def cull(ob1: Object, obs: list[Object]) -> tuple[list[Object], list[Object]]:
+    lo, hi = bounds(ob1)
+    keep = []
+    culled = []
 
     for ob in obs:
-        ob_eval = ob.evaluated_get(depsgraph)
-        me = ob_eval.to_mesh()
-        me.transform(ob.matrix_world)
+        ob_lo, ob_hi = bounds(ob)
+        if np.all(ob_lo <= hi) and np.all(lo <= ob_hi):
+            keep.append(ob)
+        else:
+            culled.append(ob)
+
+    return keep, culled
+
 
-        bm.from_mesh(me)
+def clusters(obs: list[Object], size: int) -> list[list[Object]]:
+    centers = np.array([bounds(ob).mean(axis=0) for ob in obs])
 
-        ob_eval.to_mesh_clear()
+    # Median split along the longest axis
+    def split(indices: np.ndarray) -> list[np.ndarray]:
+        if len(indices) <= size:
+            return [indices]
+        co = centers[indices]
+        axis = int(np.argmax(np.ptp(co, axis=0)))
+        indices = indices[np.argsort(co[:, axis], kind="stable")]
+        mid = len(indices) // 2
+        return split(indices[:mid]) + split(indices[mid:])
 
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=props.merge_distance)
+    return [[obs[i] for i in indices] for indices in split(np.arange(len(obs)))]
+
+
+def _sweep_and_prune(bboxes: np.ndarray) -> Iterator[tuple[int, int]]:
+    active = []
+
+    for i in np.argsort(bboxes[:, 0, 0]):
+        lo, hi = bboxes[i]
+        active = [j for j in active if bboxes[j, 1, 0] >= lo[0]]
+
+        for j in active:
+            if np.all(bboxes[j, 0] <= hi) and np.all(lo <= bboxes[j, 1]):
+                yield int(j), int(i)
+
+        active.append(i)
+
+
+def _bvh(ob: Object, depsgraph: bpy.types.Depsgraph) -> bvhtree.BVHTree:
+    ob_eval = ob.evaluated_get(depsgraph)
+    me = ob_eval.to_mesh()
+
+    bm = bmesh.new()
+    bm.from_mesh(me)
+    bm.transform(ob.matrix_world)
+
+    ob_eval.to_mesh_clear()
 
     tree = bvhtree.BVHTree.FromBMesh(bm, epsilon=0.00001)
-    overlap = tree.overlap(tree)
+    bm.free()
+    return tree
+
+
+def detect_overlap(obs: list[Object]) -> list[set[int]]:
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    graph = [set() for _ in obs]
+    trees = {}
+
+    if len(obs) < 2:
+        return graph
+
+    for i, j in _sweep_and_prune(np.array([bounds(ob) for ob in obs])):
+        for k in (i, j):
+            if k not in trees:
+                trees[k] = _bvh(obs[k], depsgraph)
+
+        if trees[i].overlap(trees[j]):
+            graph[i].add(j)
+            graph[j].add(i)
+
+    return graph
+
+
+def components(graph: list[set[int]]) -> list[list[int]]:
+    visited = set()
+    comps = []
+
+    for i in range(len(graph)):
+        if i in visited:
+            continue
+
+        visited.add(i)
+        stack = [i]
+        comp = []
+
+        while stack:
+            j = stack.pop()
+            comp.append(j)
+            for k in graph[j] - visited:
+                visited.add(k)
+                stack.append(k)
+
+        comps.append(sorted(comp))
+
+    return comps
+
+
+def owner_index(owners: list[Object]) -> tuple[list[np.ndarray], list[bvhtree.BVHTree]]:
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    return [bounds(ob) for ob in owners], [_bvh(ob, depsgraph) for ob in owners]
+
+
+def owner_find(index: tuple[list[np.ndarray], list[bvhtree.BVHTree]], obs: list[Object], tolerance: float) -> list[int]:
+    bboxes, trees = index
+    indices = []
+
+    for ob in obs:
+        lo, hi = bounds(ob)
+        candidates = [
+            i for i, (owner_lo, owner_hi) in enumerate(bboxes)
+            if np.all(owner_lo - tolerance <= lo) and np.all(hi <= owner_hi + tolerance)
+        ] or list(range(len(bboxes)))
+
+        if len(candidates) > 1:
+            me = ob.data
+            co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+            me.vertices.foreach_get("co", co)
+            co.shape = (-1, 3)
+            mat = ob.matrix_world
+            co = [mat @ Vector(v) for v in co[::max(1, len(co) // 4096)]]
+
+            dists = [
+                min((trees[i].find_nearest(v)[3] or np.inf for v in co), default=np.inf)
+                for i in candidates
+            ]
+            candidates = [candidates[int(np.argmin(dists))]]
+
+        indices.append(candidates[0])
+
+    return indices
+
+
+def _world_co(ob: Object) -> np.ndarray:
+    me = ob.data
+    co = np.empty(len(me.vertices) * 3, dtype=np.float64)
+    me.vertices.foreach_get("co", co)
+    co.shape = (-1, 3)
+    mat = np.array(ob.matrix_world)
+    return co @ mat[:3, :3].T + mat[:3, 3]
+
+
+def convex_planes(ob: Object, limit: int = 256) -> tuple[np.ndarray, np.ndarray] | None:
+    if ob.type != "MESH" or not ob.data.polygons or is_nonmanifold(ob):
+        return
+
+    me = ob.data
+    mat = np.array(ob.matrix_world)
+    co = _world_co(ob)
+
+    normals = np.empty(len(me.polygons) * 3, dtype=np.float64)
+    me.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3) @ np.linalg.inv(mat[:3, :3])
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 0.0
+    normals = normals[valid] / lengths[valid, None]
+
+    centers = np.empty(len(me.polygons) * 3, dtype=np.float64)
+    me.polygons.foreach_get("center", centers)
+    centers = centers.reshape(-1, 3)[valid] @ mat[:3, :3].T + mat[:3, 3]
+
+    materials = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("material_index", materials)
+
+    planes, indices = np.unique(np.round(np.c_[normals, np.sum(normals * centers, axis=1)], 6), axis=0, return_index=True)
+    if len(planes) > limit:
+        return
+
+    # All vertices behind every face plane
+    eps = 0.00001 * max(1.0, float(np.abs(co).max()))
+    if np.any(co @ planes[:, :3].T - planes[:, 3] > eps):
+        return
+
+    return planes, materials[valid][indices]
+
+
+def clip(ob: Object, planes: np.ndarray, materials: list[int], bbox: np.ndarray, dist: float = 0.00001) -> bool:
+    me = ob.data
+    mat = ob.matrix_world
+
+    if not me.polygons:
+        return False
+
+    # Faces outside cutter bounds are outside of convex volume
+    co = _world_co(ob)
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+    loop_start = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_start", loop_start)
+
+    loop_co = co[loop_verts]
+    lo, hi = bbox
+    outside = (
+        np.any(np.minimum.reduceat(loop_co, loop_start) > hi + dist, axis=1) |
+        np.any(np.maximum.reduceat(loop_co, loop_start) < lo - dist, axis=1)
+    )
+
+    bm = bmesh.new()
+    bm.from_mesh(me)
+    bm.faces.ensure_lookup_table()
+    bmesh.ops.delete(bm, geom=[bm.faces[i] for i in np.flatnonzero(outside).tolist()], context="FACES")
+    bm.transform(mat)
+
+    for plane, mat_index in zip(planes, materials):
+        no = Vector(plane[:3])
+        res = bmesh.ops.bisect_plane(
+            bm,
+            geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
+            dist=dist,
+            plane_co=no * plane[3],
+            plane_no=no,
+            clear_outer=True,
+        )
+        edges = [x for x in res["geom_cut"] if isinstance(x, bmesh.types.BMEdge) and x.is_valid and x.is_boundary]
+        if edges:
+            # Scanfill handles nested loops as holes
+            faces = bmesh.ops.triangle_fill(bm, edges=edges, use_beauty=True, normal=no)["geom"]
+            faces = [x for x in faces if isinstance(x, bmesh.types.BMFace)]
+            bmesh.ops.recalc_face_normals(bm, faces=faces)
+            for face in faces:
+                face.material_index = mat_index
+
+    # Empty result, primary object faces were all outside cutter bounds
+    is_closed = bool(bm.faces) and all(len(e.link_faces) == 2 for e in bm.edges)
+    if is_closed:
+        bm.transform(mat.inverted())
+        bm.to_mesh(me)
 
     bm.free()
-    return bool(overlap)
+    return is_closed
 
 
-def is_nonmanifold(ob: Object) -> bool:
+def _islands(me: Mesh) -> np.ndarray:
+    # Vectorized union-find, returns island root for each vertex
+    edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edges)
+    edges.shape = (-1, 2)
+    parent = np.arange(len(me.vertices))
+
+    while True:
+        a = parent[edges[:, 0]]
+        b = parent[edges[:, 1]]
+        if np.array_equal(a, b):
+            return parent
+
+        np.minimum.at(parent, np.maximum(a, b), np.minimum(a, b))
+
+        while not np.array_equal(root := parent[parent], parent):
+            parent = root
+
+
+def islands_select(ob: Object, obs: list[Object]) -> bool:
+    me = ob.data
+    if not me.polygons:
+        return False
+
+    bboxes = np.array([bounds(x) for x in obs])
+
+    labels = _islands(me)
+    roots, labels = np.unique(labels, return_inverse=True)
+    if len(roots) < 2:
+        return False
+
+    co = _world_co(ob)
+    lo = np.full((len(roots), 3), np.inf)
+    hi = np.full((len(roots), 3), -np.inf)
+    np.minimum.at(lo, labels, co)
+    np.maximum.at(hi, labels, co)
+
+    touched = np.any(
+        np.all(lo[:, None] <= bboxes[None, :, 1], axis=2) & np.all(bboxes[None, :, 0] <= hi[:, None], axis=2),
+        axis=1,
+    )
+    if touched.all():
+        return False
+
+    # Select untouched islands
+    vert_sel = ~touched[labels]
+
+    edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edges)
+    loop_start = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_start", loop_start)
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+
+    me.vertices.foreach_set("select", vert_sel)
+    me.edges.foreach_set("select", vert_sel[edges[::2]])
+    me.polygons.foreach_set("select", vert_sel[loop_verts[loop_start]])
+
+    return True
+
+
+def _box_planes(bbox: np.ndarray) -> list[tuple[Vector, Vector]]:
+    lo, hi = bbox
+    planes = []
+
+    for axis in range(3):
+        no = Vector((0.0, 0.0, 0.0))
+        no[axis] = 1.0
+        planes.append((Vector(hi), no))
+        planes.append((Vector(lo), -no))
+
+    return planes
+
+
+def region_bounds(obs: list[Object], pad_min: float) -> np.ndarray:
+    bboxes = np.array([bounds(ob) for ob in obs])
+    bbox = np.array((bboxes[:, 0].min(axis=0), bboxes[:, 1].max(axis=0)))
+    pad = max(float(np.linalg.norm(bbox[1] - bbox[0])) * 0.01, pad_min)
+    return bbox + ((-pad,), (pad,))
+
+
+def region_split(ob: Object, bbox: np.ndarray, dist: float = 0.00001, limit: float = 0.5) -> Object | None:
+    me = ob.data
+    mat = ob.matrix_world
+    lo, hi = bbox
+
+    if not me.polygons:
+        return
+
+    co = _world_co(ob)
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+    loop_start = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_start", loop_start)
+
+    loop_co = co[loop_verts]
+    near = np.flatnonzero(
+        np.all(np.minimum.reduceat(loop_co, loop_start) <= hi, axis=1) &
+        np.all(np.maximum.reduceat(loop_co, loop_start) >= lo, axis=1)
+    )
+
+    # Region is not much smaller than the whole mesh
+    if not len(near) or len(near) > len(me.polygons) * limit:
+        return
+
+    # Region, clipped by box sides one at a time, each cut closed with cap,
+    # so caps include box edges where surface crosses them
+    bm_region = bmesh.new()
+    bm_region.from_mesh(me)
+    bm_region.transform(mat)
+
+    for plane_co, plane_no in _box_planes(bbox):
+        res = bmesh.ops.bisect_plane(
+            bm_region,
+            geom=bm_region.verts[:] + bm_region.edges[:] + bm_region.faces[:],
+            dist=dist,
+            plane_co=plane_co,
+            plane_no=plane_no,
+            clear_outer=True,
+        )
+        edges = [x for x in res["geom_cut"] if isinstance(x, bmesh.types.BMEdge) and x.is_valid and x.is_boundary]
+        if edges:
+            for f in bmesh.ops.triangle_fill(bm_region, edges=edges, use_beauty=True, normal=plane_no)["geom"]:
+                if isinstance(f, bmesh.types.BMFace):
+                    f.normal_update()
+                    if f.normal.dot(plane_no) < 0.0:
+                        f.normal_flip()
+
+    if not bm_region.faces or not all(len(e.link_faces) == 2 for e in bm_region.edges):
+        bm_region.free()
+        return
+
+    me.polygons.foreach_set("select", np.zeros(len(me.polygons), dtype=bool))
+
     bm = bmesh.new()
-    bm.from_mesh(ob.data)
+    bm.from_mesh(me)
+    bm.transform(mat)
+    bm.faces.ensure_lookup_table()
 
-    for e in bm.edges:
-        if not e.is_manifold:
-            bm.free()
-            return True
+    # Cut faces along box sides
+    faces = [bm.faces[i] for i in near.tolist()]
+    geom = list({v for f in faces for v in f.verts}) + list({e for f in faces for e in f.edges}) + faces
+
+    for plane_co, plane_no in _box_planes(bbox):
+        geom = bmesh.ops.bisect_plane(bm, geom=geom, dist=dist, plane_co=plane_co, plane_no=plane_no)["geom"]
+
+    lo_ = Vector(lo - dist)
+    hi_ = Vector(hi + dist)
+    for f in geom:
+        if isinstance(f, bmesh.types.BMFace):
+            c = f.calc_center_median()
+            f.select = all(lo_[i] <= c[i] <= hi_[i] for i in range(3))
 
+    # Remainder
+    bmesh.ops.delete(bm, geom=[f for f in geom if isinstance(f, bmesh.types.BMFace) and f.select], context="FACES")
+
+    mat_inv = mat.inverted()
+    bm.transform(mat_inv)
+    bm.to_mesh(me)
     bm.free()
-    return False
+
+    me_region = me.copy()
+    bm_region.transform(mat_inv)
+    bm_region.to_mesh(me_region)
+    bm_region.free()
+
+    ob_region = ob.copy()
+    ob_region.data = me_region
+    for coll in ob.users_collection:
+        coll.objects.link(ob_region)
+
+    return ob_region
+
+
+def region_join(ob: Object, ob_region: Object, bbox: np.ndarray, replace: bool = False, dist: float = 0.00001) -> None:
+    me = ob.data
+
+    if replace:
+        name = me.name
+        ob.data, ob_region.data = ob_region.data, me
+        ob.data.name = name
+        bpy.data.meshes.remove(me)
+        return
+
+    mat = ob.matrix_world
+
+    bm = bmesh.new()
+    bm.from_mesh(me)
+    verts_old = len(bm.verts)
+    bm.from_mesh(ob_region.data)
+    bm.verts.index_update()
+    bm.transform(mat)
+
+    # Remove box side caps, secondary objects inside the box do not touch them
+    faces = [f for f in bm.faces if f.verts[0].index >= verts_old]
+    caps = []
+
+    for plane_co, plane_no in _box_planes(bbox):
+        caps += [
+            f for f in faces
+            if f.normal.dot(plane_no) > 0.999 and all(abs((v.co - plane_co).dot(plane_no)) <= dist for v in f.verts)
+        ]
+
+    bmesh.ops.delete(bm, geom=caps, context="FACES")
+    bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.is_boundary], dist=dist)
+
+    bm.transform(mat.inverted())
+    bm.to_mesh(me)
+    bm.free()
+
+    bpy.data.meshes.remove(ob_region.data)
+
+
+def has_holes(ob: Object) -> bool:
+    ob_eval = ob.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    me = ob_eval.to_mesh()
+    result = bool(np.any(_edge_face_count(me) == 1))
+    ob_eval.to_mesh_clear()
+    return result
+
+
+def is_self_intersecting(ob: Object) -> bool:
+    tree = _bvh(ob, bpy.context.evaluated_depsgraph_get())
+    return bool(tree.overlap(tree))
+
+
+def is_nonmanifold(ob: Object) -> bool:
+    return bool(np.any(_edge_face_count(ob.data) != 2))
+
+
+def is_nonmanifold_evaluated(ob: Object) -> bool:
+    ob_eval = ob.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    me = ob_eval.to_mesh()
+    result = bool(np.any(_edge_face_count(me) != 2))
+    ob_eval.to_mesh_clear()
+    return result
@@ -1,15 +1,28 @@
 # SPDX-FileCopyrightText: 2014-2026 Mikhail Rachinskiy
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from collections.abc import Iterator
+import hashlib
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
 import bpy
-from bpy.types import GeometryNode, Modifier, NodeGroup, NodeSocket, NodeSocketGeometry, Object
+from bpy.types import Collection, GeometryNode, Modifier, NodeGroup, NodeSocket, NodeSocketGeometry, Object
+from mathutils import Matrix
 
 from .. import var
 
+CORE_VERSION = 1
+TREE_LEAF = 8
+
+# Secondary object session_uid -> {(owner session_uid, modifier name)}
+_index: dict[int, set[tuple[int, str]]] = {}
+# Owner session_uid -> Booltron modifiers and node groups at index time
+_index_mods: dict[int, tuple[tuple[str, str], ...]] = {}
+# Owner session_uid -> owner object, reset on undo and file load
+_index_owners: dict[int, Object] = {}
+_index_state = {"valid": False, "edited": False, "scene": 0, "ob_count": 0}
+
 
 def disable_mods(value: bool) -> None:
     for ob in bpy.context.scene.objects:
@@ -19,14 +32,355 @@ def disable_mods(value: bool) -> None:
                     md.show_viewport = value
 
 
+# Reverse index
+# ---------------------------
+
+
+def index_invalidate() -> None:
+    _index_state["valid"] = False
+
+
+def index_validate(depsgraph: bpy.types.Depsgraph) -> None:
+    if not _index_state["valid"]:
+        return
+
+    is_edited = _index_state["edited"]
+    _index_state["edited"] = False
+
+    if len(bpy.data.objects) != _index_state["ob_count"]:
+        index_invalidate()
+        return
+
+    if not is_edited:
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.NodeTree) and "booltron" in update.id:
+                index_invalidate()
+                return
+
+            # Modifiers copied, added or assigned Booltron node group
+            if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+                ob = update.id.original
+                if _mods_key(ob) != _index_mods.get(ob.session_uid, ()):
+                    index_invalidate()
+                    return
+
+
+def index_lookup(obs: Iterable[Object]) -> dict[Object, list[Modifier]]:
+    if not _index_state["valid"] or _index_state["scene"] != bpy.context.scene.session_uid:
+        _index_build()
+
+    if (users := _index_query(obs)) is None:
+        _index_build()
+        users = _index_query(obs, strict=False)
+
+    return users
+
+
+def _index_query(obs: Iterable[Object], strict: bool = True) -> dict[Object, list[Modifier]] | None:
+    users = {}
+
+    for ob in obs:
+        for owner_uid, md_name in _index.get(ob.session_uid, ()):
+            try:
+                owner = _index_owners.get(owner_uid)
+                md = None if owner is None else owner.modifiers.get(md_name)
+            except ReferenceError:  # Removed object
+                md = None
+            if md is None or not ModGN.is_gn_mod(md) or ob not in ModGN.get_obs(md):
+                if strict:
+                    return None
+                continue
+            users.setdefault(owner, set()).add(md_name)
+
+    return {owner: [md for md in owner.modifiers if md.name in names] for owner, names in users.items()}
+
+
+def _index_build() -> None:
+    _index.clear()
+    _index_mods.clear()
+    _index_owners.clear()
+
+    for ob in bpy.context.scene.objects:
+        for md in ob.modifiers:
+            if ModGN.is_gn_mod(md):
+                _index_add(md, ModGN.get_obs(md))
+
+    _index_state["valid"] = True
+    _index_state["scene"] = bpy.context.scene.session_uid
+    _index_state["ob_count"] = len(bpy.data.objects)
+
+
+def _mods_key(ob: Object) -> tuple[tuple[str, str], ...]:
+    return tuple((md.name, md.node_group.name) for md in ob.modifiers if ModGN.is_gn_mod(md))
+
+
+def _index_add(md: Modifier, obs: Iterable[Object]) -> None:
+    owner = md.id_data
+    key = (owner.session_uid, md.name)
+    for ob in obs:
+        _index.setdefault(ob.session_uid, set()).add(key)
+    _index_mods[owner.session_uid] = _mods_key(owner)
+    _index_owners[owner.session_uid] = owner
+    _index_state["edited"] = True
+
+
+def _index_remove(md: Modifier, obs: Iterable[Object]) -> None:
+    owner = md.id_data
+    key = (owner.session_uid, md.name)
+    for ob in obs:
+        if (keys := _index.get(ob.session_uid)) is not None:
+            keys.discard(key)
+    _index_state["edited"] = True
+
+
+# Transform preview
+# ---------------------------
+
+
+def preview_set(md: Modifier) -> bool:
+    ng = md.node_group
+    if (core := ng.nodes.get("CORE")) is None or "booltron_core" in ng:
+        return False
+
+    ng["booltron_core"] = core.node_tree.name
+    settings = {"solver": "FLOAT", "solver_secondary": "FLOAT", "use_tree": core.node_tree.name.endswith(" T")}  # Secondary union outside core
+    core.node_tree = ModGN(ng["booltron"], settings)._core()
+
+    # Float core has no Exact secondary input, join both collectors
+    if (secondary_exact := ng.nodes.get("SECONDARY_EXACT")) is not None:
+        ng.links.new(secondary_exact.outputs["Instances"], ng.nodes["SECONDARY"].inputs["Geometry"])
+
+    return True
+
+
+def preview_clear(md: Modifier) -> None:
+    ng = md.node_group
+    if (name := ng.pop("booltron_core", None)) is None:
+        return
+
+    if (core := ng.nodes.get("CORE")) is not None and (ng_core := bpy.data.node_groups.get(name)) is not None:
+        core.node_tree = ng_core
+
+        if (secondary_exact := ng.nodes.get("SECONDARY_EXACT")) is not None and "Secondary Exact" in core.inputs:
+            for link in list(secondary_exact.outputs["Instances"].links):
+                ng.links.remove(link)
+            ng.links.new(secondary_exact.outputs["Instances"], core.inputs["Secondary Exact"])
+
+
+# Bake scheduling
+# ---------------------------
+
+
+def bake_schedule(mds: Iterable[Modifier], downstream: bool = True) -> list[list[list[Modifier]]]:
+    # Waves of per object modifier chains in dependency order,
+    # chains within the same wave do not depend on each other
+
+    starts: dict[Object, int] = {}
+    queue = []
+
+    def mark(md: Modifier) -> None:
+        ob = md.id_data
+        i = ob.modifiers.find(md.name)
+        if ob not in starts:
+            queue.append(ob)
+            starts[ob] = i
+        else:
+            starts[ob] = min(starts[ob], i)
+
+    for md in mds:
+        mark(md)
+
+    # Objects whose secondary objects are Booltron results depend on them
+    consumers: dict[Object, set[Object]] = {}
+
+    while queue:
+        ob = queue.pop()
+        consumers[ob] = set()
+        for owner, owner_mds in index_lookup((ob,)).items():
+            if owner == ob:
+                continue
+            consumers[ob].add(owner)
+            if downstream:
+                for md in owner_mds:
+                    mark(md)
+
+    indegree = dict.fromkeys(starts, 0)
+    for ob, owners in consumers.items():
+        for owner in owners:
+            if owner in indegree:
+                indegree[owner] += 1
+
+    waves = []
+    wave = [ob for ob, n in indegree.items() if n == 0]
+
+    while wave:
+        waves.append(wave)
+        wave_next = []
+        for ob in wave:
+            for owner in consumers.get(ob, ()):
+                if owner in indegree:
+                    indegree[owner] -= 1
+                    if indegree[owner] == 0:
+                        wave_next.append(owner)
+        wave = wave_next
+
+    # Dependency cycle
+    if (rest := [ob for ob, n in indegree.items() if n > 0]):
+        waves.append(rest)
+
+    return [
+        [[md for md in ob.modifiers[starts[ob]:] if ModGN.is_gn_mod(md)] for ob in wave]
+        for wave in waves
+    ]
+
+
+# Node groups
+# ---------------------------
+
+
+def node_groups_dedup() -> int:
+    import re
+
+    count = 0
+
+    # Legacy per-modifier node groups
+    # ---------------------------
+
+    legacy = {}
+    for ob in bpy.data.objects:
+        for md in ob.modifiers:
+            if ModGN.is_gn_mod(md) and "CORE" not in md.node_group.nodes:
+                legacy.setdefault(md.node_group.name, []).append(md)
+
+    for md, *mds in legacy.values():
+        ng = md.node_group
+        Mod = ModGN(ng["booltron"], _legacy_settings(ng))
+        Mod.rebuild(md, ModGN.get_obs(md))
+        count += 1
+
+        for md_user in mds:
+            md_user.node_group = md.node_group
+
+        for md_user in (md, *mds):
+            if ModGN.is_baked(md_user):
+                ModGN.bake(md_user)
+
+    # Duplicate shared node groups
+    # ---------------------------
+
+    shared = {}
+    for ng in bpy.data.node_groups:
+        if ng.name.startswith(".booltron"):
+            shared.setdefault(re.sub(r"\.\d{3}$", "", ng.name), []).append(ng)
+
+    for name, ngs in shared.items():
+        ngs.sort(key=lambda x: x.name)
+        ng_main, *ngs = ngs
+
+        for ng in ngs:
+            ng.user_remap(ng_main)
+            bpy.data.node_groups.remove(ng)
+            count += 1
+
+        ng_main.name = name
+
+    return count
+
+
+def _legacy_settings(ng: NodeGroup) -> dict[str, str | float | bool]:
+    prefs = bpy.context.preferences.addons[var.ADDON_ID].preferences
+    nodes = ng.nodes
+    settings = {}
+
+    for suffix, node in (("", nodes["PRIMARY"]), ("_secondary", nodes["SECONDARY"])):
+        is_exact = node.solver == "EXACT"
+        settings[f"solver{suffix}"] = node.solver
+        settings[f"use_self{suffix}"] = is_exact and node.inputs["Self Intersection"].default_value
+        settings[f"use_hole_tolerant{suffix}"] = is_exact and node.inputs["Hole Tolerant"].default_value
+
+    settings["merge_distance"] = next(
+        (x.inputs["Distance"].default_value for x in nodes if x.bl_idname == "GeometryNodeMergeByDistance"),
+        prefs.merge_distance,
+    )
+    settings["use_cull"] = "BOUNDS" in nodes
+    settings["use_collection"] = any(x.type == "COLLECTION_INFO" for x in nodes)
+
+    return settings
+
+
 def _walk_tree(node: GeometryNode) -> Iterator[GeometryNode]:
     for input_ in node.inputs:
         for link in input_.links:
-            if link.from_node.type != "GROUP_INPUT":
+            if link.from_node.type != "GROUP_INPUT" and link.from_node.name != "BOUNDS":
                 yield link.from_node
                 yield from _walk_tree(link.from_node)
 
 
+def _solver_key(solver: str, use_self: bool, use_hole_tolerant: bool) -> str:
+    if solver != "EXACT":
+        return solver[0]
+    return "E" + "S" * use_self + "H" * use_hole_tolerant
+
+
+def is_cutter_set(ob: Object) -> bool:
+    return bool(ob.get("booltron_cutter_set"))
+
+
+def cutter_set_expand(obs: Iterable[Object]) -> list[Object]:
+    expanded = []
+
+    for ob in obs:
+        if is_cutter_set(ob):
+            for md in ob.modifiers:
+                if ModGN.is_gn_mod(md):
+                    expanded += ModGN.get_obs(md)
+        else:
+            expanded.append(ob)
+
+    return expanded
+
+
+def cutter_set_add(obs: list[Object], settings: dict[str, str | float | bool], coll: Collection) -> tuple[Object, Modifier]:
+    # Empty primary object, union result is the union of secondary objects
+    settings = settings.copy()
+    for prop in ("solver", "use_self", "use_hole_tolerant"):
+        settings[prop] = settings[f"{prop}_secondary"]
+
+    me = bpy.data.meshes.new("Cutter Set")
+    ob = bpy.data.objects.new("Cutter Set", me)
+    ob["booltron_cutter_set"] = True
+    coll.objects.link(ob)
+
+    md = ModGN("UNION", settings_resolve(settings, ob, obs)).add(ob, obs)
+
+    return ob, md
+
+
+def settings_resolve(settings: dict[str, str | float | bool], ob1: Object, obs: list[Object]) -> dict[str, str | float | bool]:
+    from . import meshlib
+
+    def is_manifold(obs: Iterable[Object]) -> bool:
+        return all(ob.type == "MESH" and not meshlib.is_nonmanifold_evaluated(ob) for ob in obs)
+
+    settings = settings.copy()
+    obs = cutter_set_expand(obs)
+
+    # Secondary Auto solver is resolved per object in node group
+    if settings["solver"] == "AUTO":
+        settings["solver"] = "MANIFOLD" if is_manifold((ob1, *obs)) else "FLOAT"
+
+    # Exact solver flags only for operands that need them
+    if settings.get("use_exact_auto"):
+        if settings["solver"] == "EXACT":
+            settings["use_self"] = meshlib.is_self_intersecting(ob1)
+            settings["use_hole_tolerant"] = any(meshlib.has_holes(ob) for ob in (ob1, *obs))
+        if settings["solver_secondary"] == "EXACT":
+            settings["use_self_secondary"] = any(meshlib.is_self_intersecting(ob) for ob in obs)
+            settings["use_hole_tolerant_secondary"] = any(meshlib.has_holes(ob) for ob in obs)
+
+    return settings
+
+
 def secondary_visibility_set(ob: Object, display_type="TEXTURED") -> None:
     visible = display_type == "TEXTURED"
 
@@ -62,6 +416,11 @@ class ModGN:
         "use_loc_rnd",
         "loc_offset",
         "seed",
+        "use_cull",
+        "use_collection",
+        "use_render_exact",
+        "use_tree",
+        "use_bake_secondary",
     )
 
     def __init__(self, mode: str, settings: dict[str, str | float | bool]) -> None:
@@ -70,6 +429,14 @@ class ModGN:
         for prop in self.__slots__[1:]:
             setattr(self, prop, settings.get(prop))
 
+        # Collection content is not known in advance
+        if self.use_collection:
+            self.use_tree = False
+            if self.solver_secondary == "AUTO":
+                self.solver_secondary = "EXACT"
+                self.use_self_secondary = True
+                self.use_hole_tolerant_secondary = True
+
     def add(self, ob1: Object, obs: list[Object], md: Modifier | None = None, show_viewport: bool = True) -> Modifier:
         name = f"{ob1.name} {self.mode.title()}"
         ng = bpy.data.node_groups.new(name, "GeometryNodeTree")
@@ -86,6 +453,9 @@ class ModGN:
         sock_seed = ng.interface.new_socket("Seed", in_out="INPUT", socket_type="NodeSocketInt", parent=panel_rnd)
         sock_seed.force_non_field = True
 
+        panel_attr = ng.interface.new_panel("Attributes", default_closed=True)
+        sock_attr_name = ng.interface.new_socket("Intersecting Edges", description="Mark intersecting edges", in_out="INPUT", socket_type="NodeSocketString", parent=panel_attr)
+
         nodes = ng.nodes
 
         in_ = nodes.new("NodeGroupInput")
@@ -107,106 +477,304 @@ class ModGN:
             in_geo = weld.outputs["Geometry"]
 
         out = nodes.new("NodeGroupOutput")
-        out.location.x = 600
+        out.location.x = 800
         out.select = False
         out_geo = out.inputs[sock_geo_out.identifier]
 
         bake = nodes.new("GeometryNodeBake")
-        bake.location.x = 400
+        bake.location.x = 600
         bake.select = False
         bake.bake_items.clear()  # VER < 5.0
         bake.bake_items.new("GEOMETRY", "Geometry")
 
         ng.links.new(bake.outputs["Geometry"], out_geo)
 
+        core = nodes.new("GeometryNodeGroup")
+        core.name = "CORE"
+        core.node_tree = self._core()
+        core.location.x = 400
+        core.select = False
+
+        ng.links.new(in_geo, core.inputs["Geometry"])
+        ng.links.new(in_.outputs[sock_attr_name.identifier], core.inputs["Intersecting Edges"])
+        ng.links.new(core.outputs["Geometry"], bake.inputs["Geometry"])
+
+        sock_secondary = core.inputs["Secondary"]
+        if self.use_bake_secondary:
+            sock_secondary = self._bake_secondary_add(ng, sock_secondary)
+
+        if self.use_collection:
+            _out = self._coll_add(ng, name, obs, in_ofst, in_seed)
+            if self.use_bake_secondary:
+                union = self._union_add(ng, False, -200, -250)
+                ng.links.new(_out, union.inputs["Mesh 2"])
+                _out = union.outputs["Mesh"]
+            ng.links.new(_out, sock_secondary)
+        else:
+            if self.use_tree or self.use_bake_secondary:
+                if self.use_tree:
+                    ng["booltron_tree"] = True
+                targets = self._tree_add(ng, obs, sock_secondary, TREE_LEAF if self.use_tree else len(obs))
+            else:
+                secondary = nodes.new("GeometryNodeGeometryToInstance")
+                secondary.name = "SECONDARY"
+                secondary.location = 200, -250
+                secondary.select = False
+
+                ng.links.new(secondary.outputs["Instances"], core.inputs["Secondary"])
+                targets = {ob: self._secondary_get(ng, ob) for ob in obs}
+
+            # Baked secondary union does not follow primary object bounds
+            if (use_cull := self.use_cull and self.mode == "DIFFERENCE" and not self.use_bake_secondary):
+                self._bounds_add(ng, in_geo)
+
+            seed = 0
+            for ob in obs:
+                _out = self._ob_add(ng, ob, in_ofst, in_seed, seed)
+                if use_cull:
+                    _out = self._cull_add(ng, _out)
+                ng.links.new(_out, targets[ob])
+                seed += 1
+
+        if (is_md_new := not md):
+            md = ob1.modifiers.new(self.mode.title(), "NODES")
+            md.show_viewport = show_viewport
+            md.show_in_editmode = False
+            md.show_expanded = False
+
+        md.show_group_selector = False
+
+        if self.use_loc_rnd:
+            md[sock_ofst.identifier] = self.loc_offset
+            md[sock_seed.identifier] = self.seed
+
+        md.node_group = ng
+        md.bake_target = "DISK"
+
+        if is_md_new:
+            prefs = bpy.context.preferences.addons[var.ADDON_ID].preferences
+            self.md_input_set(md, sock_attr_name.identifier, prefs.attribute_edge_intersect)
+
+        _index_add(md, obs)
+
+        return md
+
+    def _core(self) -> NodeGroup:
+        key_primary = _solver_key(self.solver, self.use_self, self.use_hole_tolerant)
+        key_secondary = _solver_key(self.solver_secondary, self.use_self_secondary, self.use_hole_tolerant_secondary)
+        name = f".booltron_core.{CORE_VERSION} {self.mode.title()} {key_primary} {key_secondary}"
+        if self.use_render_exact:
+            name += " R"
+        if self.use_tree or self.use_bake_secondary:
+            name += " T"
+
+        if (ng := bpy.data.node_groups.get(name)) is not None:
+            return ng
+
+        ng = bpy.data.node_groups.new(name, "GeometryNodeTree")
+        ng.color_tag = "GEOMETRY"
+
+        sock_geo_in = ng.interface.new_socket("Geometry", in_out="INPUT", socket_type="NodeSocketGeometry")
+        sock_geo_out = ng.interface.new_socket("Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry")
+        sock_secondary = ng.interface.new_socket("Secondary", in_out="INPUT", socket_type="NodeSocketGeometry")
+        sock_attr_name = ng.interface.new_socket("Intersecting Edges", in_out="INPUT", socket_type="NodeSocketString")
+
+        nodes = ng.nodes
+
+        in_ = nodes.new("NodeGroupInput")
+        in_.location.x = -200
+        in_.select = False
+        in_geo = in_.outputs[sock_geo_in.identifier]
+        in_secondary = in_.outputs[sock_secondary.identifier]
+        in_attr_name = in_.outputs[sock_attr_name.identifier]
+        in_secondary_exact = None
+
+        # Non-manifold secondary objects are joined with Exact solver
+        if self.solver_secondary == "AUTO" and not (self.use_tree or self.use_bake_secondary):
+            sock_secondary_exact = ng.interface.new_socket("Secondary Exact", in_out="INPUT", socket_type="NodeSocketGeometry")
+            in_secondary_exact = in_.outputs[sock_secondary_exact.identifier]
+
+        out = nodes.new("NodeGroupOutput")
+        out.location.x = 400
+        out.select = False
+        out_geo = out.inputs[sock_geo_out.identifier]
+
+        geo = self._core_path(
+            ng,
+            (in_geo, in_secondary, in_secondary_exact, in_attr_name),
+            (self.solver, self.use_self, self.use_hole_tolerant),
+            (self.solver_secondary, self.use_self_secondary, self.use_hole_tolerant_secondary),
+        )
+
+        if self.use_render_exact:
+            out.location.x = 800
+
+            geo_render = self._core_path(
+                ng,
+                (in_geo, in_secondary, in_secondary_exact, in_attr_name),
+                ("EXACT", True, True),
+                ("EXACT", True, True),
+                suffix="_RENDER",
+                y=-900,
+            )
+
+            # Exact input forces render path, used for bake
+            sock_exact = ng.interface.new_socket("Exact", in_out="INPUT", socket_type="NodeSocketBool")
+
+            is_viewport = nodes.new("GeometryNodeIsViewport")
+            is_viewport.location = 400, 130
+            is_viewport.select = False
+
+            cond = nodes.new("FunctionNodeBooleanMath")
+            cond.operation = "NIMPLY"
+            cond.location = 600, 130
+            cond.select = False
+
+            switch = nodes.new("GeometryNodeSwitch")
+            switch.input_type = "GEOMETRY"
+            switch.location.x = 600
+            switch.select = False
+
+            ng.links.new(is_viewport.outputs[0], cond.inputs[0])
+            ng.links.new(in_.outputs[sock_exact.identifier], cond.inputs[1])
+            ng.links.new(cond.outputs[0], switch.inputs["Switch"])
+            ng.links.new(geo_render, switch.inputs["False"])
+            ng.links.new(geo, switch.inputs["True"])
+            geo = switch.outputs[0]
+
+        ng.links.new(geo, out_geo)
+
+        return ng
+
+    def _core_path(
+        self,
+        ng: NodeGroup,
+        inputs: tuple[NodeSocket, NodeSocket, NodeSocket | None, NodeSocket],
+        settings: tuple[str, bool, bool],
+        settings_secondary: tuple[str, bool, bool],
+        suffix: str = "",
+        y: int = 0,
+    ) -> NodeSocket:
+        in_geo, in_secondary, in_secondary_exact, in_attr_name = inputs
+        nodes = ng.nodes
+
         primary = nodes.new("GeometryNodeMeshBoolean")
-        primary.name = "PRIMARY"
+        primary.name = "PRIMARY" + suffix
         primary.operation = self.mode
-        primary.solver = self.solver
-        if self.solver == "EXACT":
-            primary.inputs["Self Intersection"].default_value = self.use_self
-            primary.inputs["Hole Tolerant"].default_value = self.use_hole_tolerant
+        self._solver_set(primary, *settings)
+        primary.location.y = y
         primary.select = False
 
         ng.links.new(in_geo, primary.inputs["Mesh 1" if self.mode == "DIFFERENCE" else "Mesh 2"])
 
-        panel_attr = ng.interface.new_panel("Attributes", default_closed=True)
-        sock_attr_name = ng.interface.new_socket("Intersecting Edges", description="Mark intersecting edges", in_out="INPUT", socket_type="NodeSocketString", parent=panel_attr)
-
-        if self.solver == "FLOAT":
+        if settings[0] == "FLOAT":
             str_len = nodes.new("FunctionNodeStringLength")
-            str_len.location.y = 130
+            str_len.location.y = y + 130
             str_len.select = False
 
             warn = nodes.new("GeometryNodeWarning")
             warn.warning_type = "WARNING"
             warn.inputs["Message"].default_value = "Float solver does not support attributes"
-            warn.location = 200, 130
+            warn.location = 200, y + 130
             warn.select = False
 
-            ng.links.new(primary.outputs["Mesh"], bake.inputs["Geometry"])
             ng.links.new(str_len.outputs["Length"], warn.inputs["Show"])
-            ng.links.new(in_.outputs[sock_attr_name.identifier], str_len.inputs["String"])
+            ng.links.new(in_attr_name, str_len.inputs["String"])
+            geo = primary.outputs["Mesh"]
         else:
             attr = nodes.new("GeometryNodeStoreNamedAttribute")
             attr.data_type = "BOOLEAN"
             attr.domain = "EDGE"
             attr.inputs["Value"].default_value = True
-            attr.location.x = 200
+            attr.location = 200, y
             attr.select = False
 
             ng.links.new(primary.outputs["Mesh"], attr.inputs["Geometry"])
             ng.links.new(primary.outputs["Intersecting Edges"], attr.inputs["Selection"])
-            ng.links.new(in_.outputs[sock_attr_name.identifier], attr.inputs["Name"])
-            ng.links.new(attr.outputs["Geometry"], bake.inputs["Geometry"])
+            ng.links.new(in_attr_name, attr.inputs["Name"])
+            geo = attr.outputs["Geometry"]
+
+        # Secondary objects are joined in wrapper node group
+        if self.use_tree or self.use_bake_secondary:
+            ng.links.new(in_secondary, primary.inputs["Mesh 2"])
+            return geo
+
+        is_split = settings_secondary[0] == "AUTO"
 
         secondary = nodes.new("GeometryNodeMeshBoolean")
-        secondary.name = "SECONDARY"
+        secondary.name = "SECONDARY" + suffix
         secondary.operation = "UNION"
-        secondary.solver = self.solver_secondary
-        if self.solver_secondary == "EXACT":
-            secondary.inputs["Self Intersection"].default_value = self.use_self_secondary
-            secondary.inputs["Hole Tolerant"].default_value = self.use_hole_tolerant_secondary
-        secondary.location.y = -250
+        self._solver_set(secondary, *(("MANIFOLD", False, False) if is_split else settings_secondary))
+        secondary.location.y = y - 250
         secondary.select = False
 
-        ng.links.new(secondary.outputs["Mesh"], primary.inputs["Mesh 2"])
-
-        seed = 0
-        for ob in obs:
-            _out = self._ob_add(ng, ob, in_ofst, in_seed, seed)
-            ng.links.new(_out, secondary.inputs["Mesh 2"])
-            seed += 1
+        ng.links.new(in_secondary, secondary.inputs["Mesh 2"])
 
-        if (is_md_new := not md):
-            md = ob1.modifiers.new(self.mode.title(), "NODES")
-            md.show_viewport = show_viewport
-            md.show_in_editmode = False
-            md.show_expanded = False
-
-        md.show_group_selector = False
-
-        if self.use_loc_rnd:
-            md[sock_ofst.identifier] = self.loc_offset
-            md[sock_seed.identifier] = self.seed
-
-        md.node_group = ng
-        md.bake_target = "DISK"
-
-        if is_md_new:
-            prefs = bpy.context.preferences.addons[var.ADDON_ID].preferences
-            self.md_input_set(md, sock_attr_name.identifier, prefs.attribute_edge_intersect)
-
-        return md
+        if in_secondary_exact is None:
+            ng.links.new(secondary.outputs["Mesh"], primary.inputs["Mesh 2"])
+        elif not is_split:
+            ng.links.new(in_secondary_exact, secondary.inputs["Mesh 2"])
+            ng.links.new(secondary.outputs["Mesh"], primary.inputs["Mesh 2"])
+        else:
+            secondary_exact = nodes.new("GeometryNodeMeshBoolean")
+            secondary_exact.name = "SECONDARY_EXACT" + suffix
+            secondary_exact.operation = "UNION"
+            self._solver_set(secondary_exact, "EXACT", True, True)
+            secondary_exact.location.y = y - 450
+            secondary_exact.select = False
+
+            ng.links.new(in_secondary_exact, secondary_exact.inputs["Mesh 2"])
+
+            # Multiple operands would be intersected with each other
+            if self.mode == "INTERSECT":
+                join = nodes.new("GeometryNodeMeshBoolean")
+                join.name = "SECONDARY_JOIN" + suffix
+                join.operation = "UNION"
+                self._solver_set(join, "EXACT", True, True)
+                join.location.y = y - 650
+                join.select = False
+
+                ng.links.new(secondary.outputs["Mesh"], join.inputs["Mesh 2"])
+                ng.links.new(secondary_exact.outputs["Mesh"], join.inputs["Mesh 2"])
+                ng.links.new(join.outputs["Mesh"], primary.inputs["Mesh 2"])
+            else:
+                ng.links.new(secondary.outputs["Mesh"], primary.inputs["Mesh 2"])
+                ng.links.new(secondary_exact.outputs["Mesh"], primary.inputs["Mesh 2"])
+
+        return geo
 
     def add_and_apply(self, ob1: Object, obs: list[Object], remove_obs: bool = True) -> None:
-        md = self.add(ob1, obs, show_viewport=False)
-        ng = md.node_group
+        from . import cachelib
+
+        prefs = bpy.context.preferences.addons[var.ADDON_ID].preferences
+        key = None
+
+        if prefs.use_cache:
+            settings = {prop: getattr(self, prop) for prop in self.__slots__[1:]}
+            settings["attribute_edge_intersect"] = prefs.attribute_edge_intersect
+            key = cachelib.key(ob1, obs, self.mode, settings)
+
+        if key is not None and (me := cachelib.load(key)) is not None:
+            me_old = ob1.data
+            name = me_old.name
+            ob1.data = me
+            bpy.data.meshes.remove(me_old)
+            me.name = name
+        else:
+            md = self.add(ob1, obs, show_viewport=False)
+            ng = md.node_group
+            coll = self._coll_get(md)
+            _index_remove(md, obs)
 
-        with bpy.context.temp_override(object=ob1):
-            bpy.ops.object.modifier_apply(modifier=md.name)
+            with bpy.context.temp_override(object=ob1):
+                bpy.ops.object.modifier_apply(modifier=md.name)
 
-        bpy.data.node_groups.remove(ng)
+            bpy.data.node_groups.remove(ng)
+            if coll is not None:
+                bpy.data.collections.remove(coll)
+
+            if key is not None:
+                cachelib.store(key, ob1.data, prefs.cache_size)
 
         if remove_obs:
             for ob in obs:
@@ -218,18 +786,198 @@ class ModGN:
 
         ng = md.node_group
         nodes = ng.nodes
+        ng_obs = self.get_obs(md)
+
+        # Legacy node group, union tree or baked secondary union
+        if "CORE" not in nodes or self.use_tree or ng.get("booltron_tree") or self.use_bake_secondary or "BAKE_SECONDARY" in nodes:
+            self.rebuild(md, ng_obs + [ob for ob in obs if ob not in ng_obs])
+            md.show_viewport = show_viewport
+            return
+
+        core = nodes["CORE"]
+        core.node_tree = self._core()
 
-        ng_obs = set()
         for node in nodes:
-            if node.type == "OBJECT_INFO" and (ob := node.inputs["Object"].default_value):
-                ng_obs.add(ob)
-        ng_obs.update(obs)
+            if node.bl_idname == "GeometryNodeMergeByDistance":
+                node.inputs["Distance"].default_value = self.merge_distance
 
-        bpy.data.node_groups.remove(ng)
-        self.add(md.id_data, ng_obs, md=md)
+        in_ = next(x for x in nodes if x.type == "GROUP_INPUT")
+        in_ofst = in_.outputs["Offset"]
+        in_seed = in_.outputs["Seed"]
+
+        if self.use_loc_rnd:
+            self.md_input_set(md, in_ofst.identifier, self.loc_offset)
+            self.md_input_set(md, in_seed.identifier, self.seed)
+
+        _index_add(md, obs)
+
+        if (coll := self._coll_get(md)) is not None:
+            for ob in obs:
+                if ob not in ng_obs:
+                    coll.objects.link(ob)
+            md.show_viewport = show_viewport
+            return
+
+        if (use_cull := self.use_cull and self.mode == "DIFFERENCE") and "BOUNDS" not in nodes:
+            self._bounds_add(ng, core.inputs["Geometry"].links[0].from_socket)
+
+        # Move secondary objects back to common union
+        if self.solver_secondary != "AUTO" and (secondary_exact := nodes.get("SECONDARY_EXACT")) is not None:
+            for link in secondary_exact.inputs["Geometry"].links:
+                ng.links.new(link.from_socket, nodes["SECONDARY"].inputs["Geometry"])
+            nodes.remove(secondary_exact)
+
+        # Route existing secondary objects by manifoldness
+        elif self.solver_secondary == "AUTO":
+            for link in list(nodes["SECONDARY"].inputs["Geometry"].links):
+                node = next((x for x in _walk_tree(link.from_node) if x.type == "OBJECT_INFO"), None)
+                if node and (ob := node.inputs["Object"].default_value):
+                    if (sock := self._secondary_get(ng, ob)) != link.to_socket:
+                        from_socket = link.from_socket
+                        ng.links.remove(link)
+                        ng.links.new(from_socket, sock)
+
+        seed = 1 + max((x.inputs["Value_001"].default_value for x in nodes if x.bl_idname == "FunctionNodeIntegerMath"), default=-1)
+        for ob in obs:
+            if ob in ng_obs:
+                continue
+            _out = self._ob_add(ng, ob, in_ofst, in_seed, seed)
+            if use_cull:
+                _out = self._cull_add(ng, _out)
+            ng.links.new(_out, self._secondary_get(ng, ob))
+            seed += 1
 
         md.show_viewport = show_viewport
 
+    def _secondary_get(self, ng: NodeGroup, ob: Object) -> NodeSocketGeometry:
+        from . import meshlib
+
+        nodes = ng.nodes
+
+        if self.solver_secondary != "AUTO" or all(x.type == "MESH" and not meshlib.is_nonmanifold_evaluated(x) for x in cutter_set_expand((ob,))):
+            return nodes["SECONDARY"].inputs["Geometry"]
+
+        if (secondary := nodes.get("SECONDARY_EXACT")) is None:
+            secondary = nodes.new("GeometryNodeGeometryToInstance")
+            secondary.name = "SECONDARY_EXACT"
+            secondary.location = 200, -450
+            secondary.select = False
+
+            ng.links.new(secondary.outputs["Instances"], nodes["CORE"].inputs["Secondary Exact"])
+
+        return secondary.inputs["Geometry"]
+
+    def _union_add(self, ng: NodeGroup, manifold: bool, x: int, y: int) -> GeometryNode:
+        node = ng.nodes.new("GeometryNodeMeshBoolean")
+        node.operation = "UNION"
+        if self.solver_secondary != "AUTO":
+            self._solver_set(node, self.solver_secondary, self.use_self_secondary, self.use_hole_tolerant_secondary)
+        elif manifold:
+            self._solver_set(node, "MANIFOLD", False, False)
+        else:
+            self._solver_set(node, "EXACT", True, True)
+        node.location = x, y
+        node.select = False
+        return node
+
+    def _tree_add(self, ng: NodeGroup, obs: list[Object], sock_out: NodeSocket, leaf_size: int) -> dict[Object, NodeSocket]:
+        from . import meshlib
+
+        nodes = ng.nodes
+        targets = {}
+        level = []
+
+        # Spatial clusters
+        for i, cluster in enumerate(meshlib.clusters(obs, leaf_size)):
+            collector = nodes.new("GeometryNodeGeometryToInstance")
+            collector.name = f"SECONDARY_{i}"
+            collector.location = -200, -250 - i * 150
+            collector.select = False
+
+            manifold = all(ob.type == "MESH" and not meshlib.is_nonmanifold_evaluated(ob) for ob in cutter_set_expand(cluster))
+            node = self._union_add(ng, manifold, 0, -250 - i * 150)
+            ng.links.new(collector.outputs["Instances"], node.inputs["Mesh 2"])
+            level.append((node.outputs["Mesh"], manifold))
+
+            for ob in cluster:
+                targets[ob] = collector.inputs["Geometry"]
+
+        # Balanced pairwise unions
+        x = 0
+        while len(level) > 1:
+            x += 100
+            level_next = []
+
+            for i in range(0, len(level) - 1, 2):
+                (a, a_manifold), (b, b_manifold) = level[i], level[i + 1]
+                node = self._union_add(ng, a_manifold and b_manifold, x, -250 - i * 150)
+                ng.links.new(a, node.inputs["Mesh 2"])
+                ng.links.new(b, node.inputs["Mesh 2"])
+                level_next.append((node.outputs["Mesh"], a_manifold and b_manifold))
+
+            if len(level) % 2:
+                level_next.append(level[-1])
+
+            level = level_next
+
+        ng.links.new(level[0][0], sock_out)
+
+        return targets
+
+    @staticmethod
+    def _bake_secondary_add(ng: NodeGroup, sock_out: NodeSocket) -> NodeSocketGeometry:
+        nodes = ng.nodes
+
+        # Bake in world space, so primary object transform does not invalidate it
+        self_ob = nodes.new("GeometryNodeSelfObject")
+        self_ob.location = 0, -100
+        self_ob.select = False
+
+        info = nodes.new("GeometryNodeObjectInfo")
+        info.transform_space = "ORIGINAL"
+        info.location = 0, -150
+        info.hide = True
+        info.select = False
+
+        invert = nodes.new("FunctionNodeInvertMatrix")
+        invert.location = 200, -100
+        invert.hide = True
+        invert.select = False
+
+        bake = nodes.new("GeometryNodeBake")
+        bake.name = "BAKE_SECONDARY"
+        bake.location = 400, -250
+        bake.select = False
+        bake.bake_items.clear()  # VER < 5.0
+        bake.bake_items.new("GEOMETRY", "Geometry")
+
+        to_world, to_local = nodes.new("GeometryNodeTransform"), nodes.new("GeometryNodeTransform")
+        to_world.location = 200, -250
+        to_local.location = 600, -250
+        for trfm in (to_world, to_local):
+            if "Mode" in trfm.inputs:  # VER >= 5.0
+                trfm.inputs["Mode"].default_value = "Matrix"
+            else:
+                trfm.mode = "MATRIX"
+            trfm.select = False
+
+        ng.links.new(self_ob.outputs["Self Object"], info.inputs["Object"])
+        ng.links.new(info.outputs["Transform"], to_world.inputs["Transform"])
+        ng.links.new(info.outputs["Transform"], invert.inputs["Matrix"])
+        ng.links.new(invert.outputs["Matrix"], to_local.inputs["Transform"])
+        ng.links.new(to_world.outputs["Geometry"], bake.inputs["Geometry"])
+        ng.links.new(bake.outputs["Geometry"], to_local.inputs["Geometry"])
+        ng.links.new(to_local.outputs["Geometry"], sock_out)
+
+        return to_world.inputs["Geometry"]
+
+    def rebuild(self, md: Modifier, obs: list[Object]) -> None:
+        if (coll := self._coll_get(md)) is not None:
+            bpy.data.collections.remove(coll)
+
+        bpy.data.node_groups.remove(md.node_group)
+        self.add(md.id_data, obs, md=md)
+
     def _ob_add(self, ng: NodeGroup, ob: Object, in_ofst: NodeSocket, in_seed: NodeSocket, seed: int = 0) -> NodeSocketGeometry:
         nodes = ng.nodes
 
@@ -268,25 +1016,166 @@ class ModGN:
 
         return rnd.outputs["Geometry"]
 
+    def _coll_add(self, ng: NodeGroup, name: str, obs: list[Object], in_ofst: NodeSocket, in_seed: NodeSocket) -> NodeSocketGeometry:
+        coll = bpy.data.collections.new(name)
+        for ob in obs:
+            coll.objects.link(ob)
+
+        nodes = ng.nodes
+
+        node = nodes.new("GeometryNodeCollectionInfo")
+        node.inputs["Collection"].default_value = coll
+        node.inputs["Separate Children"].default_value = True
+        node.transform_space = "RELATIVE"
+        node.location = -600, -250
+        node.select = False
+
+        # Weld non-mesh objects, applies to geometry of each instance
+        weld = nodes.new("GeometryNodeMergeByDistance")
+        weld.inputs["Distance"].default_value = self.merge_distance
+        weld.location = -400, -250
+        weld.select = False
+
+        trfm = nodes.new("GeometryNodeTranslateInstances")
+        trfm.location = -200, -250
+        trfm.select = False
+
+        ng.links.new(node.outputs["Instances"], weld.inputs["Geometry"])
+        ng.links.new(weld.outputs["Geometry"], trfm.inputs["Instances"])
+
+        rnd = nodes.new("FunctionNodeRandomValue")
+        rnd.data_type = "FLOAT_VECTOR"
+        rnd.location = -400, -450
+        rnd.select = False
+
+        ng.links.new(rnd.outputs["Value"], trfm.inputs["Translation"])
+        ng.links.new(in_ofst, rnd.inputs["Max"])
+        ng.links.new(in_seed, rnd.inputs["Seed"])
+
+        flip_sign = nodes.new("ShaderNodeMath")
+        flip_sign.operation = "MULTIPLY"
+        flip_sign.location = -600, -500
+        flip_sign.select = False
+        flip_sign.inputs["Value_001"].default_value = -1.0
+
+        ng.links.new(flip_sign.outputs["Value"], rnd.inputs["Min"])
+        ng.links.new(in_ofst, flip_sign.inputs["Value"])
+
+        return trfm.outputs["Instances"]
+
+    @staticmethod
+    def _coll_get(md: Modifier) -> Collection | None:
+        for node in md.node_group.nodes:
+            if node.type == "COLLECTION_INFO":
+                return node.inputs["Collection"].default_value
+
+    @staticmethod
+    def _solver_set(node: GeometryNode, solver: str, use_self: bool, use_hole_tolerant: bool) -> None:
+        node.solver = solver
+        if solver == "EXACT":
+            node.inputs["Self Intersection"].default_value = use_self
+            node.inputs["Hole Tolerant"].default_value = use_hole_tolerant
+
+    @staticmethod
+    def _bounds_add(ng: NodeGroup, in_geo: NodeSocketGeometry) -> None:
+        bbox = ng.nodes.new("GeometryNodeBoundBox")
+        bbox.name = "BOUNDS"
+        bbox.location = -200, -100
+        bbox.select = False
+
+        ng.links.new(in_geo, bbox.inputs["Geometry"])
+
+    @staticmethod
+    def _cull_add(ng: NodeGroup, geo: NodeSocketGeometry) -> NodeSocketGeometry:
+        nodes = ng.nodes
+        bbox1 = nodes["BOUNDS"]
+        y = geo.node.location.y
+
+        bbox2 = nodes.new("GeometryNodeBoundBox")
+        bbox2.location = 0, y - 200
+        bbox2.select = False
+
+        ng.links.new(geo, bbox2.inputs["Geometry"])
+
+        cmp_min = nodes.new("FunctionNodeCompare")
+        cmp_min.data_type = "VECTOR"
+        cmp_min.mode = "ELEMENT"
+        cmp_min.operation = "LESS_EQUAL"
+        cmp_min.location = 200, y - 200
+        cmp_min.hide = True
+        cmp_min.select = False
+
+        ng.links.new(bbox2.outputs["Min"], cmp_min.inputs["A_VEC3"])
+        ng.links.new(bbox1.outputs["Max"], cmp_min.inputs["B_VEC3"])
+
+        cmp_max = nodes.new("FunctionNodeCompare")
+        cmp_max.data_type = "VECTOR"
+        cmp_max.mode = "ELEMENT"
+        cmp_max.operation = "LESS_EQUAL"
+        cmp_max.location = 200, y - 250
+        cmp_max.hide = True
+        cmp_max.select = False
+
+        ng.links.new(bbox1.outputs["Min"], cmp_max.inputs["A_VEC3"])
+        ng.links.new(bbox2.outputs["Max"], cmp_max.inputs["B_VEC3"])
+
+        overlap = nodes.new("FunctionNodeBooleanMath")
+        overlap.operation = "AND"
+        overlap.location = 400, y - 200
+        overlap.hide = True
+        overlap.select = False
+
+        ng.links.new(cmp_min.outputs["Result"], overlap.inputs[0])
+        ng.links.new(cmp_max.outputs["Result"], overlap.inputs[1])
+
+        sw = nodes.new("GeometryNodeSwitch")
+        sw.input_type = "GEOMETRY"
+        sw.location = 400, y
+        sw.select = False
+
+        ng.links.new(overlap.outputs["Boolean"], sw.inputs["Switch"])
+        ng.links.new(geo, sw.inputs["True"])
+
+        return sw.outputs["Output"]
+
     @staticmethod
     def remove(md: Modifier, obs: set[Object]) -> bool:
         show_viewport = md.show_viewport
         md.show_viewport = False
         nodes = md.node_group.nodes
+        coll = ModGN._coll_get(md)
         has_obs = False
 
-        for link in nodes["SECONDARY"].inputs["Mesh 2"].links:
-            _del = {x.type: x for x in _walk_tree(link.from_node)}
-
-            if (node := _del.get("OBJECT_INFO")) and (ob := node.inputs["Object"].default_value):
-                if ob not in obs:
-                    has_obs = True
-                    continue
-                secondary_visibility_set(ob)
+        _index_remove(md, obs)
 
-            nodes.remove(link.from_node)
-            for node in _del.values():
-                nodes.remove(node)
+        if coll is not None:
+            for ob in obs:
+                if ob.name in coll.objects:
+                    coll.objects.unlink(ob)
+                    secondary_visibility_set(ob)
+            has_obs = bool(coll.objects)
+        else:
+            links = []
+            for node in nodes:
+                if node.name.startswith("SECONDARY"):
+                    if node.type == "MESH_BOOLEAN":  # Legacy node group
+                        links += node.inputs["Mesh 2"].links
+                    else:
+                        links += node.inputs["Geometry"].links
+
+            for link in links:
+                _del = {x.name: x for x in _walk_tree(link.from_node)}
+                node = next((x for x in _del.values() if x.type == "OBJECT_INFO"), None)
+
+                if node and (ob := node.inputs["Object"].default_value):
+                    if ob not in obs:
+                        has_obs = True
+                        continue
+                    secondary_visibility_set(ob)
+
+                nodes.remove(link.from_node)
+                for node in _del.values():
+                    nodes.remove(node)
 
         if has_obs:
             md.show_viewport = show_viewport
@@ -297,15 +1186,25 @@ class ModGN:
         ModGN.bake_del(md)
         ob.modifiers.remove(md)
         bpy.data.node_groups.remove(ng)
+        if coll is not None:
+            bpy.data.collections.remove(coll)
         return True
 
     @staticmethod
-    def has_obs(md: Modifier, obs: set[Object]) -> bool:
+    def get_obs(md: Modifier) -> list[Object]:
+        obs = []
+
         for node in md.node_group.nodes:
-            if node.type == "OBJECT_INFO" and node.inputs["Object"].default_value in obs:
-                return True
+            if node.type == "OBJECT_INFO" and (ob := node.inputs["Object"].default_value):
+                obs.append(ob)
+            elif node.type == "COLLECTION_INFO" and (coll := node.inputs["Collection"].default_value):
+                obs += coll.objects
 
-        return False
+        return obs
+
+    @staticmethod
+    def has_obs(md: Modifier, obs: set[Object]) -> bool:
+        return not obs.isdisjoint(ModGN.get_obs(md))
 
     @staticmethod
     def is_gn_mod(md: Modifier) -> bool:
@@ -316,13 +1215,86 @@ class ModGN:
         return md.node_group["booltron"] == mode
 
     @staticmethod
-    def bake(md: Modifier) -> None:
-        if bpy.data.is_saved:
-            bpy.ops.object.geometry_node_bake_single(session_uid=md.id_data.session_uid, modifier_name=md.name, bake_id=md.bakes[0].bake_id)
+    def bake(md: Modifier) -> bool:
+        if not bpy.data.is_saved:
+            return False
+
+        ng = md.node_group
+        fingerprint = ModGN.fingerprint(md)
+        if ModGN.is_baked(md) and ng.get("booltron_fingerprint") == fingerprint:
+            return False
+
+        # Secondary union is rebaked only when secondary objects change
+        if (bake_id := ModGN.bake_id(md, secondary=True)) is not None:
+            fingerprint_secondary = ModGN.fingerprint_secondary(md)
+            if ng.get("booltron_fingerprint_secondary") != fingerprint_secondary:
+                bpy.ops.object.geometry_node_bake_single(session_uid=md.id_data.session_uid, modifier_name=md.name, bake_id=bake_id)
+                ng["booltron_fingerprint_secondary"] = fingerprint_secondary
+
+        # Bake render path
+        if (core := ng.nodes.get("CORE")) is not None and "Exact" in core.inputs:
+            core.inputs["Exact"].default_value = True
+
+        bpy.ops.object.geometry_node_bake_single(session_uid=md.id_data.session_uid, modifier_name=md.name, bake_id=ModGN.bake_id(md))
+        ng["booltron_fingerprint"] = fingerprint
+
+        if core is not None and "Exact" in core.inputs:
+            core.inputs["Exact"].default_value = False
+        return True
 
     @staticmethod
     def bake_del(md: Modifier) -> None:
-        bpy.ops.object.geometry_node_bake_delete_single(session_uid=md.id_data.session_uid, modifier_name=md.name, bake_id=md.bakes[0].bake_id)
+        for bake in md.bakes:
+            bpy.ops.object.geometry_node_bake_delete_single(session_uid=md.id_data.session_uid, modifier_name=md.name, bake_id=bake.bake_id)
+        md.node_group.pop("booltron_fingerprint", None)
+        md.node_group.pop("booltron_fingerprint_secondary", None)
+
+    @staticmethod
+    def bake_id(md: Modifier, secondary: bool = False) -> int | None:
+        for bake in md.bakes:
+            if (bake.node.name == "BAKE_SECONDARY") is secondary:
+                return bake.bake_id
+
+    @staticmethod
+    def fingerprint(md: Modifier) -> str:
+        from . import cachelib
+
+        ob1 = md.id_data
+        h = hashlib.blake2b(digest_size=20)
+        me = ob1.to_mesh()
+        cachelib.hash_mesh(h, me)
+        ob1.to_mesh_clear()
+
+        # Primary input
+        for md_prev in ob1.modifiers:
+            if md_prev == md:
+                break
+            if not md_prev.show_viewport:
+                continue
+            if ModGN.is_gn_mod(md_prev):
+                if ModGN.is_baked(md_prev) and (fingerprint := md_prev.node_group.get("booltron_fingerprint")):
+                    h.update(fingerprint.encode())
+                else:
+                    h.update(ModGN.fingerprint(md_prev).encode())
+            else:
+                h.update(repr(_rna_values(md_prev)).encode())
+                _hash_refs(h, md_prev)
+
+        # Settings
+        _hash_nodes(h, md, md.node_group.nodes)
+
+        # Secondary input
+        _hash_obs(h, ModGN.get_obs(md), ob1.matrix_world.inverted_safe())
+
+        return h.hexdigest()
+
+    @staticmethod
+    def fingerprint_secondary(md: Modifier) -> str:
+        # World space, independent of primary object
+        h = hashlib.blake2b(digest_size=20)
+        _hash_nodes(h, md, _walk_tree(md.node_group.nodes["BAKE_SECONDARY"]))
+        _hash_obs(h, ModGN.get_obs(md), Matrix())
+        return h.hexdigest()
 
     @staticmethod
     def is_baked(md: Modifier) -> bool:
@@ -335,6 +1307,119 @@ class ModGN:
         else:
             md[prop] = value
 
+    @staticmethod
+    def md_input_get(md: Modifier, prop: str) -> Any:
+        if hasattr(md, "properties"):  # VER >= 5.2
+            return getattr(md.properties.inputs, prop).value
+        return md.get(prop)
+
+
+def _hash_nodes(h: hashlib.blake2b, md: Modifier, nodes: Iterable[GeometryNode]) -> None:
+    for node in nodes:
+        h.update(f"{node.name}:{node.bl_idname}".encode())
+        if node.bl_idname == "GeometryNodeGroup" and node.node_tree:
+            h.update(node.node_tree.name.encode())
+        for sock in node.inputs:
+            if not sock.is_linked and hasattr(sock, "default_value"):
+                h.update(repr(_value(sock.default_value)).encode())
+
+    for item in md.node_group.interface.items_tree:
+        if item.item_type == "SOCKET" and item.in_out == "INPUT" and item.socket_type != "NodeSocketGeometry":
+            h.update(repr(_value(ModGN.md_input_get(md, item.identifier))).encode())
+
+
+def _hash_obs(h: hashlib.blake2b, obs: list[Object], mat: Matrix) -> None:
+    from . import cachelib
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    for ob in obs:
+        ob_eval = ob.evaluated_get(depsgraph)
+        h.update(ob.name.encode())
+        h.update(repr(_value(mat @ ob.matrix_world)).encode())
+        me = ob_eval.to_mesh()
+        cachelib.hash_mesh(h, me)
+        ob_eval.to_mesh_clear()
+
+
+def _hash_refs(h: hashlib.blake2b, md: Modifier) -> None:
+    # Referenced objects and node trees are hashed by content, not by name
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    seen = {md.id_data.session_uid}  # Primary object is hashed by caller
+
+    for prop in md.bl_rna.properties:
+        if prop.type == "POINTER":
+            _hash_id(h, getattr(md, prop.identifier), depsgraph, seen)
+
+    if md.type == "NODES" and md.node_group:
+        for item in md.node_group.interface.items_tree:
+            if item.item_type == "SOCKET" and item.in_out == "INPUT":
+                value = ModGN.md_input_get(md, item.identifier)
+                h.update(repr(_value(value)).encode())
+                _hash_id(h, value, depsgraph, seen)
+
+
+def _hash_id(h: hashlib.blake2b, value: Any, depsgraph: bpy.types.Depsgraph, seen: set[int]) -> None:
+    from . import cachelib
+
+    if not isinstance(value, bpy.types.ID) or value.session_uid in seen:
+        return
+
+    seen.add(value.session_uid)
+
+    if isinstance(value, bpy.types.Object):
+        h.update(repr(_value(value.matrix_world)).encode())
+        if value.type in {"MESH", "CURVE", "SURFACE", "META", "FONT"}:
+            ob_eval = value.evaluated_get(depsgraph)
+            if (me := ob_eval.to_mesh()) is not None:
+                cachelib.hash_mesh(h, me)
+            ob_eval.to_mesh_clear()
+    elif isinstance(value, bpy.types.Collection):
+        for ob in value.all_objects:
+            _hash_id(h, ob, depsgraph, seen)
+    elif isinstance(value, bpy.types.NodeTree):
+        for node in value.nodes:
+            h.update(repr(_rna_values(node)).encode())
+            if node.bl_idname == "GeometryNodeGroup":
+                _hash_id(h, node.node_tree, depsgraph, seen)
+            for sock in node.inputs:
+                if not sock.is_linked and hasattr(sock, "default_value"):
+                    h.update(repr(_value(sock.default_value)).encode())
+                    _hash_id(h, sock.default_value, depsgraph, seen)
+        for link in value.links:
+            h.update(f"{link.from_node.name}:{link.from_socket.identifier}:{link.to_node.name}:{link.to_socket.identifier}".encode())
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return tuple(_value(x) for x in value)
+    return value
+
+
+def _rna_values(struct: bpy.types.bpy_struct) -> list[tuple[str, Any]]:
+    values = []
+
+    for prop in struct.bl_rna.properties:
+        if prop.type == "COLLECTION" or prop.identifier in {
+            "rna_type",
+            "is_active",
+            "show_expanded",
+            "location",
+            "location_absolute",
+            "dimensions",
+            "width",
+            "select",
+        }:
+            continue
+        value = getattr(struct, prop.identifier)
+        if prop.type == "POINTER" and not (value is None or isinstance(value, bpy.types.ID)):
+            continue
+        values.append((prop.identifier, _value(value)))
+
+    return values
+
 
 def _rnd_loc() -> NodeGroup:
     name = ".booltron_rnd_loc"
@@ -389,7 +1474,7 @@ def _rnd_loc() -> NodeGroup:
     trfm = nodes.new("GeometryNodeTransform")
     trfm.location = 200, -200
     trfm.select = False
-    if "Mode" in trfm.inputs:  # VER < 5.0
+    if "Mode" in trfm.inputs:  # VER >= 5.0
         trfm.inputs["Mode"].default_value = "Components"
 
     ng.links.new(in_geo, trfm.inputs["Geometry"])
@@ -13,6 +13,46 @@ def ob_link(ob: Object, colls: tuple[Collection]) -> None:
         ob.local_view_set(sd, True)
 
 
+def join(obs: list[Object]) -> Object:
+    ob = obs[0]
+
+    with bpy.context.temp_override(active_object=ob, selected_editable_objects=obs):
+        bpy.ops.object.join()
+
+    return ob
+
+
+def separate_loose(ob: Object) -> list[Object]:
+    for ob_sel in bpy.context.selected_objects:
+        ob_sel.select_set(False)
+
+    ob.select_set(True)
+    bpy.context.view_layer.objects.active = ob
+
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.mesh.separate(type="LOOSE")
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    return bpy.context.selected_objects
+
+
+def separate_selected(ob: Object) -> Object:
+    for ob_sel in bpy.context.selected_objects:
+        ob_sel.select_set(False)
+
+    ob.select_set(True)
+    bpy.context.view_layer.objects.active = ob
+
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.separate(type="SELECTED")
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    ob_new = next(x for x in bpy.context.selected_objects if x != ob)
+    ob_new.select_set(False)
+    return ob_new
+
+
 def prepare_objects(keep_objects: bool) -> tuple[Object, list[Object]]:
     ob1 = bpy.context.object
     obs = bpy.context.selected_objects
@@ -3,7 +3,7 @@
 
 import bpy
 from bpy.props import BoolProperty, FloatVectorProperty
-from bpy.types import Operator
+from bpy.types import Object, Operator
 
 
 def _cursor_state(func):
@@ -15,9 +15,70 @@ def _cursor_state(func):
     return wrapper
 
 
+def _apply(ob1: Object, obs: list[Object], mode: str, settings: dict[str, str | float | bool], remove_obs: bool = True) -> str:
+    from ...lib import meshlib, modlib
+
+    solvers = ("MANIFOLD", "FLOAT", "EXACT")
+
+    # Operands are checked by evaluated mesh
+    bpy.context.view_layer.update()
+    settings_auto = modlib.settings_resolve(settings, ob1, obs)
+
+    if settings["solver"] != "AUTO":
+        modlib.ModGN(mode, settings_auto).add_and_apply(ob1, obs, remove_obs=remove_obs)
+        return settings_auto["solver"]
+
+    # Auto solver, escalate until result is manifold
+    # ---------------------------------
+
+    me = ob1.data.copy()
+
+    for i in range(solvers.index(settings_auto["solver"]), len(solvers)):
+        settings_auto["solver"] = solvers[i]
+        if solvers[i] == "EXACT":
+            settings_auto["use_self"] = True
+            settings_auto["use_hole_tolerant"] = True
+
+        modlib.ModGN(mode, settings_auto).add_and_apply(ob1, obs, remove_obs=False)
+
+        if i == len(solvers) - 1 or not meshlib.is_nonmanifold(ob1):
+            break
+
+        me_result = ob1.data
+        ob1.data = me.copy()
+        bpy.data.meshes.remove(me_result)
+
+    bpy.data.meshes.remove(me)
+
+    if remove_obs:
+        for ob in obs:
+            bpy.data.meshes.remove(ob.data)
+
+    return settings_auto["solver"]
+
+
+def _batch(obs: list[Object], settings: dict[str, str | float | bool]) -> list[Object]:
+    from ...lib import meshlib, objectlib
+
+    settings = settings.copy()
+    for prop in ("solver", "use_self", "use_hole_tolerant"):
+        settings[prop] = settings[f"{prop}_secondary"]
+
+    batch = []
+    for comp in meshlib.components(meshlib.detect_overlap(obs)):
+        ob = obs[comp[0]]
+        if len(comp) > 1:
+            _apply(ob, [obs[i] for i in comp[1:]], "UNION", settings)
+        batch.append(ob)
+
+    if len(batch) > 1:
+        objectlib.join(batch)
+
+    return batch[:1]
+
+
 class Destructive:
     mode: str
-    is_overlap = True
     keep_objects: BoolProperty(
         name="Keep Objects",
         description=(
@@ -53,6 +114,8 @@ class Destructive:
                 col.prop(props, "use_self_secondary")
                 col.prop(props, "use_hole_tolerant_secondary")
 
+            col.prop(props, "use_tree")
+
         col.prop(self, "keep_objects")
 
         col.prop(props, "use_loc_rnd")
@@ -66,12 +129,64 @@ class Destructive:
         col = layout.box().column()
         col.prop(props, "merge_distance")
         col.prop(props, "dissolve_distance", text="Degenerate Dissolve", text_ctxt="Operator")
+        col.prop(props, "use_exact_auto")
+
+        if self.mode != "SLICE":
+            col.prop(props, "use_islands")
+            col.prop(props, "use_region")
+
+        if self.mode in {"INTERSECT", "SLICE"}:
+            col.prop(props, "use_convex")
 
         layout.separator()
 
+    def cull(self, ob1: Object, obs: list[Object]) -> list[Object]:
+        from ...lib import meshlib
+
+        obs, culled = meshlib.cull(ob1, obs)
+
+        if culled:
+            for ob in culled:
+                bpy.data.meshes.remove(ob.data)
+            self.report({"INFO"}, f"Culled secondary objects: {len(culled)}")
+
+        return obs
+
+    def clip(self, context, ob1: Object, ob2: Object) -> bool:
+        from ... import var
+        from ...lib import meshlib
+
+        props = context.window_manager.booltron.destructive
+        prefs = context.preferences.addons[var.ADDON_ID].preferences
+
+        # Clipping does not randomize location or mark intersecting edges
+        if not props.use_convex or props.use_loc_rnd or prefs.attribute_edge_intersect:
+            return False
+
+        context.view_layer.update()
+        if (convex := meshlib.convex_planes(ob2)) is None:
+            return False
+
+        # Cap faces take cutter face materials, same as boolean solver
+        planes, materials = convex
+        me1 = ob1.data
+        mat_map = []
+        for mat in ob2.data.materials:
+            if mat is not None and mat.name not in me1.materials:
+                me1.materials.append(mat)
+            mat_map.append(me1.materials.find(mat.name) if mat is not None else 0)
+
+        materials = [mat_map[i] if i < len(mat_map) else 0 for i in materials.tolist()]
+
+        if not meshlib.clip(ob1, planes, materials, meshlib.bounds(ob2)):
+            return False
+
+        bpy.data.meshes.remove(ob2.data)
+        return True
+
     @_cursor_state
     def execute(self, context):
-        from ...lib import meshlib, modlib, objectlib
+        from ...lib import meshlib, objectlib
 
         props = context.window_manager.booltron.destructive
         check = props.solver == "MANIFOLD" or props.solver_secondary == "MANIFOLD"
@@ -87,18 +202,49 @@ class Destructive:
                     bpy.data.meshes.remove(ob.data)
             return {"FINISHED"}
 
-        Mod = modlib.ModGN(self.mode, props.asdict())
+        if self.mode != "UNION":
+            obs = self.cull(ob1, obs)
+
+            if not obs:
+                if self.mode == "INTERSECT":
+                    ob1.data.clear_geometry()
+                return {"FINISHED"}
+
+        # Islands away from secondary objects are not affected
+        ob_rest = None
+        if props.use_islands and meshlib.islands_select(ob1, obs):
+            ob_rest = objectlib.separate_selected(ob1)
+            if self.mode == "INTERSECT":
+                bpy.data.meshes.remove(ob_rest.data)
+                ob_rest = None
+
+        if self.mode == "INTERSECT" and len(obs) == 1 and self.clip(context, ob1, obs[0]):
+            return {"FINISHED"}
+
+        # Each secondary object gets its own random offset
+        if len(obs) > 1 and not props.use_loc_rnd:
+            obs = _batch(obs, props.asdict())
 
-        if self.is_overlap or len(obs) == 1:
-            Mod.add_and_apply(ob1, obs)
+        # Solve only part of primary object near secondary objects
+        ob_region = None
+        if props.use_region:
+            context.view_layer.update()
+            bbox = meshlib.region_bounds(obs, props.merge_distance * 10)
+            ob_region = meshlib.region_split(ob1, bbox)
+
+        if ob_region is not None:
+            solver = _apply(ob_region, obs, self.mode, props.asdict())
+            meshlib.region_join(ob1, ob_region, bbox, replace=self.mode == "INTERSECT")
         else:
-            ob2 = obs[0]
-            with context.temp_override(active_object=ob2, selected_editable_objects=obs):
-                bpy.ops.object.join()
-            Mod.add_and_apply(ob1, (ob2,))
+            solver = _apply(ob1, obs, self.mode, props.asdict())
+
+        if ob_rest is not None:
+            objectlib.join([ob1, ob_rest])
 
         if meshlib.is_nonmanifold(ob1):
             self.report({"ERROR"}, "Boolean operation result is non-manifold")
+        elif props.solver == "AUTO":
+            self.report({"INFO"}, f"Solver: {solver.title()}")
 
         return {"FINISHED"}
 
@@ -117,11 +263,6 @@ class Destructive:
             self.report({"ERROR"}, "At least two objects must be selected")
             return {"CANCELLED"}
 
-        if len(obs) > 2 and self.mode != "SLICE":
-            from ...lib import meshlib
-            obs.remove(context.object)
-            self.is_overlap = meshlib.detect_overlap(obs)
-
         props = context.window_manager.booltron.destructive
         if props.first_run:
             props.first_run = False
@@ -194,7 +335,7 @@ class OBJECT_OT_destructive_slice(Destructive, Operator):
 
     @_cursor_state
     def execute(self, context):
-        from ...lib import meshlib, modlib, objectlib
+        from ...lib import meshlib, objectlib
 
         props = context.window_manager.booltron.destructive
         check = props.solver == "MANIFOLD" or props.solver_secondary == "MANIFOLD"
@@ -210,8 +351,25 @@ class OBJECT_OT_destructive_slice(Destructive, Operator):
                     bpy.data.meshes.remove(ob.data)
             return {"FINISHED"}
 
-        ModDiff = modlib.ModGN("DIFFERENCE", props.asdict())
-        ModIntr = modlib.ModGN("INTERSECT", props.asdict())
+        obs = self.cull(ob1, obs)
+        if not obs:
+            return {"FINISHED"}
+
+        settings = props.asdict()
+        ob1_copy = None
+
+        # Batch isolated secondary objects
+        # ---------------------------------
+
+        if len(obs) > 1 and not props.use_loc_rnd:
+            graph = meshlib.detect_overlap(obs)
+            singles = [ob for ob, links in zip(obs, graph) if not links]
+
+            if len(singles) > 1:
+                obs = [ob for ob, links in zip(obs, graph) if links]
+                ob1_copy = self.slice_batch(context, ob1, singles, settings)
+                if ob1_copy is None:
+                    return {"FINISHED"}
 
         for ob2 in obs:
 
@@ -228,7 +386,7 @@ class OBJECT_OT_destructive_slice(Destructive, Operator):
 
             ob2.matrix_basis.translation += self.overlap_distance / 2
 
-            ModDiff.add_and_apply(ob1, (ob2,), remove_obs=False)
+            _apply(ob1, [ob2], "DIFFERENCE", settings, remove_obs=False)
 
             if meshlib.is_nonmanifold(ob1):
                 self.report({"ERROR"}, "Boolean operation result is non-manifold")
@@ -239,7 +397,8 @@ class OBJECT_OT_destructive_slice(Destructive, Operator):
 
             ob2.matrix_basis.translation -= self.overlap_distance
 
-            ModIntr.add_and_apply(ob1_copy, (ob2,))
+            if not self.clip(context, ob1_copy, ob2):
+                _apply(ob1_copy, [ob2], "INTERSECT", settings)
 
             if meshlib.is_nonmanifold(ob1_copy):
                 self.report({"ERROR"}, "Boolean operation result is non-manifold")
@@ -249,3 +408,66 @@ class OBJECT_OT_destructive_slice(Destructive, Operator):
         context.view_layer.objects.active = ob1_copy
 
         return {"FINISHED"}
+
+    def slice_batch(self, context, ob1: Object, obs: list[Object], settings: dict[str, str | float | bool]) -> Object | None:
+        from ...lib import meshlib, objectlib
+
+        props = context.window_manager.booltron.destructive
+
+        for ob in obs:
+            ob.matrix_basis.translation -= self.overlap_distance / 2
+
+        context.view_layer.update()
+        index = meshlib.owner_index(obs)
+
+        # Create copy of main object
+        # ---------------------------------
+
+        ob1_copy = ob1.copy()
+        ob1_copy.data = ob1.data.copy()
+        objectlib.ob_link(ob1_copy, ob1.users_collection)
+
+        # Main object difference
+        # ---------------------------------
+
+        for ob in obs:
+            ob.matrix_basis.translation += self.overlap_distance
+
+        _apply(ob1, obs, "DIFFERENCE", settings, remove_obs=False)
+
+        if meshlib.is_nonmanifold(ob1):
+            self.report({"ERROR"}, "Boolean operation result is non-manifold")
+            return
+
+        # Main object copy intersect
+        # ---------------------------------
+
+        for ob in obs:
+            ob.matrix_basis.translation -= self.overlap_distance
+
+        context.view_layer.update()
+        _apply(ob1_copy, [objectlib.join(obs)], "INTERSECT", settings)
+
+        if meshlib.is_nonmanifold(ob1_copy):
+            self.report({"ERROR"}, "Boolean operation result is non-manifold")
+            return
+
+        if not ob1_copy.data.polygons:
+            ob1_copy.select_set(True)
+            return ob1_copy
+
+        # Split slices by secondary object
+        # ---------------------------------
+
+        parts = objectlib.separate_loose(ob1_copy)
+        context.view_layer.update()
+
+        groups = [[] for _ in obs]
+        for part, i in zip(parts, meshlib.owner_find(index, parts, props.merge_distance)):
+            groups[i].append(part)
+
+        for group in groups:
+            if group:
+                ob1_copy = objectlib.join(group)
+
+        return ob1_copy
@@ -5,8 +5,18 @@ import bpy
 from bpy.props import EnumProperty
 from bpy.types import Object, Operator
 
-from .bake import OBJECT_OT_instance_copy, OBJECT_OT_modifier_bake, OBJECT_OT_modifier_bake_del
-from .utils import OBJECT_OT_secondary_del, OBJECT_OT_secondary_select
+from .bake import (
+    OBJECT_OT_instance_copy,
+    OBJECT_OT_modifier_bake,
+    OBJECT_OT_modifier_bake_background,
+    OBJECT_OT_modifier_bake_del,
+)
+from .utils import (
+    OBJECT_OT_cutter_set_add,
+    OBJECT_OT_node_groups_dedup,
+    OBJECT_OT_secondary_del,
+    OBJECT_OT_secondary_select,
+)
 
 modifiers: tuple[tuple[str, str, str]] = (("__NEW__", "", ""),)
 
@@ -52,6 +62,8 @@ class Nondestructive:
     )
 
     def draw(self, context):
+        from ...lib import modlib
+
         layout = self.layout
         layout.use_property_split = True
         layout.use_property_decorate = False
@@ -78,6 +90,13 @@ class Nondestructive:
 
         col.prop(props, "display_secondary")
 
+        col.prop(props, "use_collection")
+        if not props.use_collection:
+            col.prop(props, "use_tree")
+
+        if self.mode == "DIFFERENCE" and not (props.use_collection or props.use_bake_secondary):
+            col.prop(props, "use_cull")
+
         col.prop(props, "use_loc_rnd")
         if props.use_loc_rnd:
             col.prop(props, "loc_offset", text="Offset")
@@ -88,12 +107,16 @@ class Nondestructive:
         layout.label(text="Pre-processing")
         col = layout.box().column()
         col.prop(props, "merge_distance")
+        col.prop(props, "use_exact_auto")
 
         layout.separator()
 
         layout.label(text="Modifier")
         col = layout.box().column()
-        col.prop(self, "modifier_name")
+        if not modlib.is_cutter_set(context.object):
+            col.prop(self, "modifier_name")
+        col.prop(props, "use_render_exact")
+        col.prop(props, "use_bake_secondary")
 
         sub = col.row()
         if bpy.data.is_saved:
@@ -120,32 +143,65 @@ class Nondestructive:
         # ----------------------------------
 
         props = context.window_manager.booltron.non_destructive
+
+        # Cutter set applied to selected primary objects
+        if modlib.is_cutter_set(ob1):
+            return self.execute_cutter_set(context, ob1, obs)
+
         for ob in obs:
             modlib.secondary_visibility_set(ob, props.display_secondary)
 
         # Modifier
         # ----------------------------------
 
-        Mod = modlib.ModGN(self.mode, props.asdict())
-
         if self.modifier_name == "__NEW__":
+            Mod = modlib.ModGN(self.mode, modlib.settings_resolve(props.asdict(), ob1, obs))
             md = Mod.add(ob1, obs)
         else:
             md = ob1.modifiers[self.modifier_name]
+            ng_obs = modlib.ModGN.get_obs(md)
+            obs_all = ng_obs + [ob for ob in obs if ob not in ng_obs]
+            Mod = modlib.ModGN(self.mode, modlib.settings_resolve(props.asdict(), ob1, obs_all))
             Mod.extend(md, obs)
 
         context.view_layer.update()
         if md.node_warnings:
-            _popup_warnings(md.node_warnings, props.solver == "MANIFOLD" or props.solver_secondary == "MANIFOLD")
+            _popup_warnings(md.node_warnings, Mod.solver == "MANIFOLD" or Mod.solver_secondary == "MANIFOLD")
             return {"FINISHED"}
 
         # Bake
         # ----------------------------------
 
-        i = ob1.modifiers.find(md.name)
-        for md in ob1.modifiers[i:]:
-            if Mod.is_gn_mod(md) and (Mod.is_baked(md) or props.use_bake):
-                Mod.bake(md)
+        for wave in modlib.bake_schedule((md,)):
+            for chain in wave:
+                for md in chain:
+                    if Mod.is_baked(md) or (props.use_bake and md.id_data == ob1):
+                        Mod.bake(md)
+
+        return {"FINISHED"}
+
+    def execute_cutter_set(self, context, ob_set: Object, obs: list[Object]) -> set[str]:
+        from ...lib import modlib
+
+        props = context.window_manager.booltron.non_destructive
+        modlib.secondary_visibility_set(ob_set, props.display_secondary)
+
+        mds = []
+        for ob in obs:
+            Mod = modlib.ModGN(self.mode, modlib.settings_resolve(props.asdict(), ob, [ob_set]))
+            mds.append(Mod.add(ob, [ob_set]))
+
+        context.view_layer.update()
+        for md in mds:
+            if md.node_warnings:
+                _popup_warnings(md.node_warnings, Mod.solver == "MANIFOLD" or Mod.solver_secondary == "MANIFOLD")
+                return {"FINISHED"}
+
+        for wave in modlib.bake_schedule(mds):
+            for chain in wave:
+                for md in chain:
+                    if Mod.is_baked(md) or (props.use_bake and md in mds):
+                        Mod.bake(md)
 
         return {"FINISHED"}
 
@@ -5,20 +5,34 @@ import bpy
 from bpy.props import BoolProperty
 from bpy.types import Operator
 
+from ... import var
+
 
 class Bake:
     delete: bool
 
     def execute(self, context):
+        from ...lib import modlib
         from ...lib.modlib import ModGN
 
-        for ob in context.selected_objects:
-            for md in ob.modifiers:
-                if ModGN.is_gn_mod(md):
-                    if self.delete:
-                        ModGN.bake_del(md)
-                    else:
-                        ModGN.bake(md)
+        mds = [md for ob in context.selected_objects for md in ob.modifiers if ModGN.is_gn_mod(md)]
+        skipped = 0
+
+        if self.delete:
+            for md in mds:
+                ModGN.bake_del(md)
+            return {"FINISHED"}
+
+        # Downstream modifiers are rebaked only if already baked
+        mds = set(mds)
+        for wave in modlib.bake_schedule(mds):
+            for chain in wave:
+                for md in chain:
+                    if (md in mds or ModGN.is_baked(md)) and not ModGN.bake(md):
+                        skipped += 1
+
+        if skipped:
+            self.report({"INFO"}, f"Skipped unchanged modifiers: {skipped}")
 
         return {"FINISHED"}
 
@@ -46,6 +60,143 @@ class OBJECT_OT_modifier_bake_del(Bake, Operator):
     delete = True
 
 
+class OBJECT_OT_modifier_bake_background(Operator):
+    bl_label = "Bake in Background"
+    bl_description = "Bake modifier result for selected objects in background Blender processes"
+    bl_idname = "object.booltron_modifier_bake_background"
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            self.farm.cancel()
+            return self.finish(context)
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        for key in self.farm.poll():
+            self.done.add(key)
+            if (ob := bpy.data.objects.get(key[0])) is not None:
+                ob.update_tag()
+
+        context.window_manager.progress_update(len(self.done))
+        context.workspace.status_text_set(f"Booltron bake: {len(self.done)}/{self.total}, Esc to cancel")
+
+        if self.farm.is_running():
+            return {"PASS_THROUGH"}
+
+        # Next wave depends on results of the current one
+        if self.waves and len(self.farm.done) == self.farm.total:
+            self.farm.cleanup()
+            self.farm = self.farm_next(context)
+            return {"PASS_THROUGH"}
+
+        return self.finish(context)
+
+    def farm_next(self, context):
+        from ...lib import farmlib
+
+        prefs = context.preferences.addons[var.ADDON_ID].preferences
+        return farmlib.Farm(self.waves.pop(0), prefs.bake_workers)
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        self.farm.cleanup()
+
+        # Restore fingerprints of modifiers that were not baked
+        for (ob_name, md_name), fingerprints in self.fingerprints_old.items():
+            if (ob_name, md_name) in self.done:
+                continue
+            if (ob := bpy.data.objects.get(ob_name)) and (md := ob.modifiers.get(md_name)) and md.node_group:
+                for key, fingerprint in fingerprints.items():
+                    if fingerprint is None:
+                        md.node_group.pop(key, None)
+                    else:
+                        md.node_group[key] = fingerprint
+
+        if (failed := self.total - len(self.done)):
+            if self.farm.log:
+                print("\n".join(self.farm.log))
+            self.report({"WARNING"}, f"Not baked modifiers: {failed}, see console for details")
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"Baked modifiers: {len(self.done)}")
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        from ...lib import modlib
+        from ...lib.modlib import ModGN
+
+        if not bpy.data.is_saved:
+            self.report({"ERROR"}, "File not saved")
+            return {"CANCELLED"}
+
+        mds = {md for ob in context.selected_objects for md in ob.modifiers if ModGN.is_gn_mod(md)}
+        self.waves = []
+        self.fingerprints_old = {}
+        self.total = 0
+        stem = bpy.path.display_name_from_filepath(bpy.data.filepath)
+
+        # Fingerprints are assigned in advance, so downstream fingerprints
+        # already account for upstream modifiers that are going to be rebaked
+        for wave in modlib.bake_schedule(mds):
+            jobs = []
+
+            for chain in wave:
+                job = []
+
+                for md in chain:
+                    if not job and md not in mds and not ModGN.is_baked(md):
+                        continue
+
+                    ob = md.id_data
+                    ng = md.node_group
+                    fingerprint = ModGN.fingerprint(md)
+                    if not job and ModGN.is_baked(md) and ng.get("booltron_fingerprint") == fingerprint:
+                        continue
+
+                    if not md.bake_directory:
+                        md.bake_directory = f"//{stem}_bakes/{bpy.path.clean_name(ob.name)}_{bpy.path.clean_name(md.name)}"
+
+                    fingerprints_old = {"booltron_fingerprint": ng.get("booltron_fingerprint")}
+                    ng["booltron_fingerprint"] = fingerprint
+                    bake_ids = [ModGN.bake_id(md)]
+
+                    # Secondary union is rebaked only when secondary objects change
+                    if (bake_id := ModGN.bake_id(md, secondary=True)) is not None:
+                        fingerprint_secondary = ModGN.fingerprint_secondary(md)
+                        if ng.get("booltron_fingerprint_secondary") != fingerprint_secondary:
+                            fingerprints_old["booltron_fingerprint_secondary"] = ng.get("booltron_fingerprint_secondary")
+                            ng["booltron_fingerprint_secondary"] = fingerprint_secondary
+                            bake_ids.insert(0, bake_id)
+
+                    self.fingerprints_old[(ob.name, md.name)] = fingerprints_old
+                    job.append((ob.name, md.name, bpy.path.abspath(md.bake_directory), bake_ids))
+
+                if job:
+                    jobs.append(job)
+                    self.total += len(job)
+
+            if jobs:
+                self.waves.append(jobs)
+
+        if not self.waves:
+            self.report({"INFO"}, "Nothing to bake")
+            return {"CANCELLED"}
+
+        self.done = set()
+        self.farm = self.farm_next(context)
+
+        wm = context.window_manager
+        wm.progress_begin(0, self.total)
+        self.timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+
+        return {"RUNNING_MODAL"}
+
+
 class OBJECT_OT_instance_copy(Operator):
     bl_label = "Instance Copy"
     bl_description = "Create instance mesh copy of selected objects"
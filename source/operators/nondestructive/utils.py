@@ -12,6 +12,7 @@ class OBJECT_OT_secondary_del(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
+        from ...lib import modlib
         from ...lib.modlib import ModGN
         from . import versioning
 
@@ -22,11 +23,12 @@ class OBJECT_OT_secondary_del(Operator):
         if not obs:
             return {"CANCELLED"}
 
-        for ob in context.scene.objects:
+        for ob, mds in modlib.index_lookup(obs).items():
+            md_names = {md.name for md in mds}
             bake_invalidate = False
             for md in ob.modifiers[:]:
                 if ModGN.is_gn_mod(md):
-                    if ModGN.has_obs(md, obs):
+                    if md.name in md_names:
                         bake_invalidate = True
                         if ModGN.remove(md, obs):
                             continue
@@ -54,18 +56,18 @@ class OBJECT_OT_secondary_select(Operator):
             layout.operator(op.bl_idname, text=name, translate=False).modifier_name = name
 
     def execute(self, context):
+        from ...lib.modlib import ModGN
+
         if not self.use_extend:
             for ob in context.selected_objects:
                 ob.select_set(False)
 
         md = context.object.modifiers[self.modifier_name]
         active = None
-        for node in md.node_group.nodes:
-            if node.type == "OBJECT_INFO":
-                ob = node.inputs["Object"].default_value
-                if ob is not None and ob.visible_get():
-                    ob.select_set(True)
-                    active = ob
+        for ob in ModGN.get_obs(md):
+            if ob.visible_get():
+                ob.select_set(True)
+                active = ob
 
         if not self.use_extend and active is not None:
             context.view_layer.objects.active = active
@@ -93,3 +95,62 @@ class OBJECT_OT_secondary_select(Operator):
         self.modifiers = tuple(mods)
         context.window_manager.popup_menu(self._draw_popup_menu, title="Modifiers")
         return {"CANCELLED"}
+
+
+class OBJECT_OT_cutter_set_add(Operator):
+    bl_label = "Add Cutter Set"
+    bl_description = (
+        "Join selected objects into a single secondary object, "
+        "make it active and run boolean operation to apply it to selected primary objects"
+    )
+    bl_idname = "object.booltron_cutter_set_add"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        from ...lib import modlib
+        from . import versioning
+
+        versioning.detect_and_migrate()
+
+        obs = [ob for ob in context.selected_objects if ob.type in {"MESH", "CURVE", "SURFACE", "META", "FONT"}]
+
+        if not obs:
+            self.report({"ERROR"}, "At least one object must be selected")
+            return {"CANCELLED"}
+
+        props = context.window_manager.booltron.non_destructive
+        if props.first_run:
+            props.first_run = False
+            props.set_from_prefs()
+
+        for ob in obs:
+            modlib.secondary_visibility_set(ob, props.display_secondary)
+            ob.select_set(False)
+
+        ob_set, md = modlib.cutter_set_add(obs, props.asdict(), context.collection)
+        modlib.secondary_visibility_set(ob_set, props.display_secondary)
+        ob_set.select_set(True)
+        context.view_layer.objects.active = ob_set
+
+        if props.use_bake:
+            modlib.ModGN.bake(md)
+
+        return {"FINISHED"}
+
+
+class OBJECT_OT_node_groups_dedup(Operator):
+    bl_label = "Deduplicate Node Groups"
+    bl_description = "Rebuild modifiers to use shared node groups and merge duplicate Booltron node groups"
+    bl_idname = "object.booltron_node_groups_dedup"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        from ...lib import modlib
+        from . import versioning
+
+        versioning.detect_and_migrate()
+
+        count = modlib.node_groups_dedup()
+        self.report({"INFO"}, f"Deduplicated node groups: {count}")
+
+        return {"FINISHED"}
@@ -24,6 +24,7 @@ class ToolProps:
             ("MANIFOLD", "Manifold", "Fastest, works only on manifold meshes"),
             ("FLOAT", "Float", "Good performance, doesn't work on coplanar geometry"),
             ("EXACT", "Exact", "Slowest, handles self intersection"),
+            ("AUTO", "Auto", "Fastest solver that gives manifold result, falls back from Manifold to Float and Exact"),
         ),
     )
     use_self: BoolProperty(
@@ -69,6 +70,27 @@ class ToolProps:
         ),
         default="WIRE",
     )
+    use_cull: BoolProperty(
+        name="Bounds Culling",
+        description=(
+            "Exclude secondary objects that do not overlap primary object bounding box "
+            "from Difference operation"
+        ),
+    )
+    use_collection: BoolProperty(
+        name="Use Collection",
+        description=(
+            "Reference secondary objects through a collection, "
+            "modifier node count stays the same regardless of the number of objects"
+        ),
+    )
+    use_tree: BoolProperty(
+        name="Union Tree",
+        description=(
+            "Join secondary objects by balanced tree of unions over spatial clusters "
+            "instead of single union, speeds up operations with many secondary objects"
+        ),
+    )
 
     # Pre-processing
     # ------------------------
@@ -93,6 +115,22 @@ class ToolProps:
         precision=5,
         unit="LENGTH",
     )
+    use_exact_auto: BoolProperty(
+        name="Auto Exact Flags",
+        description="Enable Self Intersection and Hole Tolerant for Exact solver only when operands need them",
+    )
+    use_islands: BoolProperty(
+        name="Skip Islands",
+        description="Solve only loose parts of primary object that touch the bounds of secondary objects",
+    )
+    use_region: BoolProperty(
+        name="Region Crop",
+        description="Solve only the part of primary object inside the bounds of secondary objects",
+    )
+    use_convex: BoolProperty(
+        name="Convex Cutters",
+        description="Intersect with convex secondary objects by clipping with their face planes instead of boolean solver",
+    )
 
     # Post-processing
     # ------------------------
@@ -101,6 +139,14 @@ class ToolProps:
         name="Bake",
         description="Bake modifier result",
     )
+    use_render_exact: BoolProperty(
+        name="Exact for Render",
+        description="Use Exact solver with self intersection and hole tolerance for render and bake, keep selected solvers in viewport",
+    )
+    use_bake_secondary: BoolProperty(
+        name="Bake Secondary",
+        description="Bake union of secondary objects separately, rebake it only when secondary objects change",
+    )
 
     def asdict(self) -> dict[str, str | float | bool]:
         return {prop: getattr(self, prop) for prop in ToolProps.__annotations__}
@@ -131,6 +177,30 @@ class Preferences(ToolProps, AddonPreferences):
         name="Intersecting Edges",
         description="Default attribute name",
     )
+    auto_bake_delay: FloatProperty(
+        name="Auto Bake Delay",
+        description="Time in seconds without changes before affected modifiers are rebaked",
+        default=0.5,
+        min=0.0,
+        step=10,
+        subtype="TIME_ABSOLUTE",
+    )
+    bake_workers: IntProperty(
+        name="Bake Workers",
+        description="Number of background Blender processes used to bake modifiers",
+        default=2,
+        min=1,
+    )
+    use_cache: BoolProperty(
+        name="Result Cache",
+        description="Store destructive operation results on disk and reuse them for identical input",
+    )
+    cache_size: IntProperty(
+        name="Cache Size",
+        description="Maximum size of the result cache in megabytes, least recently used results are removed first",
+        default=512,
+        min=1,
+    )
 
     def draw(self, context):
         ui.prefs_ui(self, context)
@@ -164,3 +234,11 @@ class SceneProperties(PropertyGroup):
         default=True,
         update=upd_mod_disable,
     )
+    use_preview: BoolProperty(
+        name="Transform Preview",
+        description="Use Float solver for modifiers affected by secondary objects while they are transformed",
+    )
+    use_auto_bake: BoolProperty(
+        name="Auto Bake",
+        description="Rebake baked modifiers when their secondary objects change",
+    )
@@ -39,12 +39,15 @@ class VIEW3D_MT_booltron(Menu):
         col.operator("object.booltron_nondestructive_intersect", icon_value=icon_menu("NONDESTR_INTERSECT"))
         col.operator("object.booltron_secondary_del", icon_value=icon_menu("NONDESTR_REMOVE"))
         col.operator("object.booltron_secondary_select", icon_value=icon_menu("NONDESTR_SELECT"))
+        col.operator("object.booltron_cutter_set_add")
 
         col.separator()
 
         col.operator("object.booltron_modifier_bake")
         col.operator("object.booltron_modifier_bake_del")
+        col.operator("object.booltron_modifier_bake_background")
         col.operator("object.booltron_instance_copy")
+        col.operator("object.booltron_node_groups_dedup")
 
 
 # Panels
@@ -94,6 +97,9 @@ class VIEW3D_PT_booltron_nondestructive(SidebarSetup, Panel):
         row = layout.row(align=True)
         row.operator("object.booltron_secondary_del", icon_value=icon("NONDESTR_REMOVE"))
         row.operator("object.booltron_secondary_select", icon_value=icon("NONDESTR_SELECT"), text="Select")
+        layout.operator("object.booltron_cutter_set_add")
+
+        layout.prop(context.scene.booltron, "use_preview")
 
         header, panel = layout.panel("bake", default_closed=True)
         header.label(text="Bake")
@@ -101,6 +107,8 @@ class VIEW3D_PT_booltron_nondestructive(SidebarSetup, Panel):
             row = panel.row(align=True)
             row.operator("object.booltron_modifier_bake")
             row.operator("object.booltron_modifier_bake_del", icon="TRASH", text="")
+            panel.operator("object.booltron_modifier_bake_background")
+            panel.prop(context.scene.booltron, "use_auto_bake")
 
             panel.operator("object.booltron_instance_copy")
 
@@ -136,6 +144,9 @@ def prefs_ui(self, context):
     col.prop(self, "use_self_secondary")
     col.prop(self, "use_hole_tolerant_secondary")
     col.prop(self, "display_secondary", text="Display As")
+    col.prop(self, "use_cull")
+    col.prop(self, "use_collection")
+    col.prop(self, "use_tree")
     col.prop(self, "loc_offset", text="Randomize Location")
 
     main.separator()
@@ -144,8 +155,21 @@ def prefs_ui(self, context):
     col = main.box().column()
     col.prop(self, "merge_distance")
     col.prop(self, "dissolve_distance")
+    col.prop(self, "use_exact_auto")
+    col.prop(self, "use_islands")
+    col.prop(self, "use_region")
+    col.prop(self, "use_convex")
+    col.prop(self, "use_cache")
+    sub = col.row()
+    sub.active = self.use_cache
+    sub.prop(self, "cache_size")
 
     main.separator()
 
     main.label(text="Modifier")
-    main.box().prop(self, "use_bake")
+    col = main.box().column()
+    col.prop(self, "use_bake")
+    col.prop(self, "use_render_exact")
+    col.prop(self, "use_bake_secondary")
+    col.prop(self, "bake_workers")
+    col.prop(self, "auto_bake_delay")
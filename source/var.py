@@ -1,8 +1,11 @@
 # SPDX-FileCopyrightText: 2014-2026 Mikhail Rachinskiy
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import tomllib
 from pathlib import Path
 
 ADDON_ID = __package__
 ADDON_DIR = Path(__file__).parent
+with open(ADDON_DIR / "blender_manifest.toml", "rb") as f:
+    ADDON_VERSION = tomllib.load(f)["version"]
 ICONS_DIR = ADDON_DIR / "assets" / "icons"
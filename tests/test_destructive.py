@@ -4,7 +4,10 @@
 import sys
 import traceback
 
+import bmesh
 import bpy
+from bpy.types import Object
+from mathutils import Vector
 
 
 def set_up(solver: str) -> None:
@@ -26,6 +29,135 @@ def cleanup() -> None:
         bpy.data.meshes.remove(me)
 
 
+def is_manifold(ob: Object) -> bool:
+    bm = bmesh.new()
+    bm.from_mesh(ob.data)
+    result = all(len(e.link_faces) == 2 for e in bm.edges)
+    bm.free()
+    return result
+
+
+def set_up_plate(cutters: int = 1) -> tuple[Object, list[Object]]:
+    obs = []
+    for i in range(cutters):
+        bpy.ops.mesh.primitive_cylinder_add(location=(i * 0.2, 0.0, 0.0))
+        ob2 = bpy.context.object
+        ob2.scale = 0.05, 0.05, 1.0
+        obs.append(ob2)
+
+    bpy.ops.mesh.primitive_cube_add()
+    ob1 = bpy.context.object
+    ob1.scale = 2.0, 2.0, 0.1
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.subdivide(number_cuts=16)
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    ob1.select_set(True)
+    for ob2 in obs:
+        ob2.select_set(True)
+
+    return ob1, obs
+
+
+def test_auto() -> None:
+    set_up("AUTO")
+    ob1 = bpy.context.object
+    bpy.ops.object.booltron_destructive_difference()
+    bpy.context.window_manager.booltron.destructive.solver = "MANIFOLD"
+
+    assert is_manifold(ob1)
+
+
+def test_cull() -> None:
+    set_up("MANIFOLD")
+    ob1 = bpy.context.object
+    ob2 = next(ob for ob in bpy.context.selected_objects if ob != ob1)
+    ob2.location.x = 5.0
+    name = ob2.name
+
+    bpy.ops.object.booltron_destructive_difference()
+
+    assert len(ob1.data.vertices) == 8
+    assert bpy.data.objects.get(name) is None
+
+
+def test_islands() -> None:
+    props = bpy.context.window_manager.booltron.destructive
+    props.use_islands = True
+
+    set_up("MANIFOLD")
+    ob1 = bpy.context.object
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.primitive_cube_add(location=(5.0, 0.0, 0.0))
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    bpy.ops.object.booltron_destructive_difference()
+    props.use_islands = False
+
+    assert is_manifold(ob1)
+    assert sum(v.co.x > 3.0 for v in ob1.data.vertices) == 8
+
+
+def test_tree() -> None:
+    props = bpy.context.window_manager.booltron.destructive
+    props.use_tree = True
+
+    set_up("MANIFOLD")
+    ob1 = bpy.context.object
+    ob2 = next(ob for ob in bpy.context.selected_objects if ob != ob1)
+    ob2.scale = 0.1, 0.1, 1.5
+
+    for i in range(12):
+        ob = ob2.copy()
+        ob.location = -0.8 + (i % 4) * 0.5, -0.6 + (i // 4) * 0.6, 0.0
+        bpy.context.collection.objects.link(ob)
+        ob.select_set(True)
+
+    bpy.ops.object.booltron_destructive_difference()
+    props.use_tree = False
+
+    assert is_manifold(ob1)
+
+
+def test_region() -> None:
+    props = bpy.context.window_manager.booltron.destructive
+    props.solver = "MANIFOLD"
+
+    ob1, _ = set_up_plate()
+    bpy.ops.object.booltron_destructive_difference()
+    vert_count = len(ob1.data.vertices)
+    cleanup()
+
+    # Cutter goes through plate surface, region is closed by caps along box edges
+    props.use_region = True
+    ob1, _ = set_up_plate()
+    bpy.ops.object.booltron_destructive_difference()
+    props.use_region = False
+
+    assert is_manifold(ob1)
+    assert len(ob1.data.vertices) > vert_count  # Seam along box sides
+    cleanup()
+
+    # Joined cutters, box covers all of them
+    ob1, _ = set_up_plate(cutters=3)
+    bpy.ops.object.booltron_destructive_difference()
+    vert_count = len(ob1.data.vertices)
+    cleanup()
+
+    props.use_region = True
+    ob1, _ = set_up_plate(cutters=3)
+    bpy.ops.object.booltron_destructive_difference()
+    props.use_region = False
+
+    assert is_manifold(ob1)
+    assert len(ob1.data.vertices) > vert_count
+
+    mat = ob1.matrix_world
+    for i in range(3):
+        center = Vector((i * 0.2, 0.0))
+        assert any(abs(((mat @ v.co).xy - center).length - 0.05) < 0.001 for v in ob1.data.vertices)
+
+
 def main() -> None:
     tools = [
         bpy.ops.object.booltron_destructive_difference,
@@ -43,6 +175,11 @@ def main() -> None:
         tool()
         cleanup()
 
+    for name, test in list(globals().items()):
+        if name.startswith("test"):
+            test()
+            cleanup()
+
 
 try:
     main()
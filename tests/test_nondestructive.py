@@ -7,6 +7,11 @@ import traceback
 from pathlib import Path
 
 import bpy
+from bpy.types import Modifier, Object
+
+
+def get_obs(md: Modifier) -> list[Object]:
+    return [node.inputs["Object"].default_value for node in md.node_group.nodes if node.type == "OBJECT_INFO" and node.inputs["Object"].default_value]
 
 
 def set_up(solver: str) -> None:
@@ -61,6 +66,23 @@ def test_text() -> None:
     bpy.ops.object.booltron_nondestructive_difference()
 
 
+def test_collection() -> None:
+    props = bpy.context.window_manager.booltron.non_destructive
+    props.use_collection = True
+    bpy.ops.object.booltron_nondestructive_difference()
+    props.use_collection = False
+
+    nodes = bpy.context.object.modifiers[0].node_group.nodes
+    assert not any(node.type == "OBJECT_INFO" for node in nodes)
+
+    coll = next(node for node in nodes if node.type == "COLLECTION_INFO").inputs["Collection"].default_value
+    assert [ob.name for ob in coll.objects] == ["OB2"]
+
+    bpy.ops.object.booltron_secondary_del()
+    assert bool(bpy.context.object.modifiers) is False
+    assert bpy.data.collections.get(coll.name) is None
+
+
 def test_dissmiss() -> None:
     bpy.ops.object.booltron_nondestructive_difference()
     ng_name = bpy.context.object.modifiers[0].node_group.name
@@ -110,11 +132,99 @@ def test_bake() -> None:
         assert (path / "blendcache_temp" / "OB49_Difference").exists() is False
 
 
+def test_tree() -> None:
+    ob1 = bpy.context.object
+    ob2 = bpy.data.objects["OB2"]
+
+    for i in range(12):
+        ob = ob2.copy()
+        ob.location.x = -0.8 + i * 0.15
+        bpy.context.collection.objects.link(ob)
+        ob.select_set(True)
+
+    props = bpy.context.window_manager.booltron.non_destructive
+    props.use_tree = True
+    bpy.ops.object.booltron_nondestructive_difference()
+    props.use_tree = False
+
+    nodes = ob1.modifiers[0].node_group.nodes
+    assert "SECONDARY_0" in nodes and "SECONDARY_1" in nodes
+    assert len(get_obs(ob1.modifiers[0])) == 13
+
+    bpy.ops.object.booltron_secondary_del()
+    assert bool(ob1.modifiers) is False
+
+
+def test_cutter_set() -> None:
+    ob1 = bpy.context.object
+    ob1.select_set(False)
+
+    bpy.ops.object.booltron_cutter_set_add()
+    ob_set = bpy.context.object
+    assert ob_set["booltron_cutter_set"] and len(ob_set.modifiers) == 1
+
+    ob1.select_set(True)
+    bpy.ops.object.booltron_nondestructive_difference()
+
+    assert get_obs(ob1.modifiers[0]) == [ob_set]
+
+
+def test_bake_secondary() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        bpy.ops.wm.save_mainfile(filepath=str(Path(tempdir) / "temp.blend"))
+
+        props = bpy.context.window_manager.booltron.non_destructive
+        props.use_bake_secondary = True
+        bpy.ops.object.booltron_nondestructive_difference()
+        props.use_bake_secondary = False
+
+        ob1 = bpy.context.object
+        ng = ob1.modifiers[0].node_group
+        assert "BAKE_SECONDARY" in ng.nodes
+
+        bpy.ops.object.booltron_modifier_bake()
+        fingerprint = ng["booltron_fingerprint_secondary"]
+
+        # Primary object transform does not invalidate secondary bake
+        ob1.location.x = 0.1
+        bpy.context.view_layer.update()
+        bpy.ops.object.booltron_modifier_bake()
+        assert ng["booltron_fingerprint_secondary"] == fingerprint
+
+        bpy.ops.object.booltron_modifier_bake_del()
+        assert "booltron_fingerprint_secondary" not in ng
+
+
+def test_dedup() -> None:
+    bpy.ops.object.booltron_nondestructive_difference()
+
+    bpy.ops.mesh.primitive_cube_add(location=(0.0, 0.0, 0.5))
+    ob3 = bpy.context.object
+    ob3.select_set(True)
+    bpy.data.objects["OB2"].select_set(True)
+    bpy.ops.object.booltron_nondestructive_difference()
+
+    bpy.ops.object.booltron_node_groups_dedup()
+    assert len([ng for ng in bpy.data.node_groups if ng.name.startswith(".booltron_core")]) == 1
+
+
 def test_instance_copy() -> None:
     bpy.ops.object.booltron_instance_copy()
     assert bpy.context.object.name == "Instance OB1"
 
 
+def test_auto() -> None:
+    props = bpy.context.window_manager.booltron.non_destructive
+    props.solver = "AUTO"
+    props.solver_secondary = "AUTO"
+    bpy.ops.object.booltron_nondestructive_difference()
+    props.solver_secondary = "MANIFOLD"
+
+    md = bpy.context.object.modifiers[0]
+    assert "SECONDARY" in md.node_group.nodes
+    assert not any(warn.type == "ERROR" for warn in md.node_warnings)
+
+
 def main() -> None:
     solvers = ["MANIFOLD", "FLOAT", "EXACT"]
     solver = "FLOAT"